@@ -1,6 +1,7 @@
 from .proposals import *
 from .tree_proposals import recom, reversible_recom, ReCom
 from .spectral_proposals import spectral_recom
+from .non_reversible_flip import NonReversibleFlip
 
 __all__ = [
     "recom",
@@ -8,4 +9,5 @@ __all__ = [
     "spectral_recom",
     "propose_chunk_flip",
     "propose_random_flip",
+    "NonReversibleFlip",
 ]
@@ -0,0 +1,76 @@
+import random
+from typing import Optional, Tuple
+
+from ..partition import Partition
+
+
+class NonReversibleFlip:
+    """
+    A lifted (non-reversible) version of :func:`propose_random_flip`.
+
+    The proposal keeps a direction: an ordered pair ``(source, target)`` of
+    adjacent parts. It only proposes flipping a boundary node of ``source``
+    into ``target``, so consecutive accepted steps keep pushing the shared
+    boundary the same way instead of diffusing back and forth. When a proposal
+    is rejected (the chain calls the proposal again on the same partition), the
+    direction is reversed. With probability ``switch_probability``, or when the
+    two parts no longer touch, a new pair is drawn from a random cut edge.
+
+    Instances hold the direction between calls, so use one instance per chain.
+    """
+
+    def __init__(self, switch_probability: float = 0.05) -> None:
+        """
+        :param switch_probability: Chance of drawing a new pair of parts before
+            each proposal. Defaults to 0.05.
+        :type switch_probability: float, optional
+
+        :returns: None
+        """
+        self.switch_probability = switch_probability
+        self.direction: Optional[Tuple] = None
+        self._last_partition: Optional[Partition] = None
+
+    def __call__(self, partition: Partition) -> Partition:
+        """
+        :param partition: The current partition to propose a flip from.
+        :type partition: Partition
+
+        :returns: A possible next `~gerrychain.Partition`
+        :rtype: Partition
+        """
+        cut_edges = tuple(partition["cut_edges"])
+        if len(cut_edges) == 0:
+            return partition
+        assignment = partition.assignment.mapping
+
+        if partition is self._last_partition and self.direction is not None:
+            # The last proposal from this partition was rejected
+            self.direction = self.direction[::-1]
+        elif self.direction is None or random.random() < self.switch_probability:
+            self.direction = self._random_direction(cut_edges, assignment)
+        self._last_partition = partition
+
+        moves = self._moves(cut_edges, assignment)
+        if not moves:
+            self.direction = self._random_direction(cut_edges, assignment)
+            moves = self._moves(cut_edges, assignment)
+
+        flipped_node = random.choice(moves)
+        return partition.flip({flipped_node: self.direction[1]})
+
+    def _moves(self, cut_edges, assignment):
+        source, target = self.direction
+        moves = []
+        for u, v in cut_edges:
+            if assignment[u] == source and assignment[v] == target:
+                moves.append(u)
+            elif assignment[v] == source and assignment[u] == target:
+                moves.append(v)
+        return moves
+
+    @staticmethod
+    def _random_direction(cut_edges, assignment):
+        edge = random.choice(cut_edges)
+        index = random.choice((0, 1))
+        return assignment[edge[index]], assignment[edge[1 - index]]
@@ -18,14 +18,30 @@ For each state, the script:
 import os
 import sys
 import json
+import functools
+import glob
+import hashlib
+import pickle
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import networkx as nx
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from gerrychain import Graph, Partition, MarkovChain
-from gerrychain.proposals import propose_random_flip
-from gerrychain.constraints import single_flip_contiguous
+from gerrychain import Graph, Partition
 from gerrychain.updaters import cut_edges, Tally
 from gerrychain.tree import recursive_tree_part
 
+# Numba is optional: without it the MCMC kernel below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 # State configuration: maps state directory names to their primary shapefile
 STATE_CONFIGS = {
@@ -65,7 +81,12 @@ STATE_CONFIGS = {
     'wisconsin': 'WI_ltsb_corrected_final.shp',
 }
 
+# Parsed state graphs (with their data columns already made numeric) are
+# pickled here, keyed by shapefile path and mtime
+GRAPH_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gerrychain_fra")
+
 
+@functools.lru_cache(maxsize=None)
 def find_shapefile(state_dir):
     """
     Find the primary shapefile for a state
@@ -85,14 +106,11 @@ def find_shapefile(state_dir):
             return shapefile
 
     # Auto-detect: find first .shp file (excluding __MACOSX)
-    for root, dirs, files in os.walk(state_dir):
-        if '__MACOSX' in root:
-            continue
-        for file in files:
-            if file.endswith('.shp') and not file.startswith('.'):
-                return os.path.join(root, file)
-
-    return None
+    candidates = (
+        path for path in glob.iglob(os.path.join(state_dir, '**', '*.shp'), recursive=True)
+        if '__MACOSX' not in path and not os.path.basename(path).startswith('.')
+    )
+    return next(candidates, None)
 
 
 def load_state_data(shapefile_path, state_name):
@@ -107,13 +125,41 @@ def load_state_data(shapefile_path, state_name):
         Graph: GerryChain graph or None on error
     """
     try:
-        print(f"  Loading {shapefile_path}...")
-        graph = Graph.from_file(shapefile_path)
-
-        # Remove isolated nodes
-        isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
-        if isolated_nodes:
-            graph.remove_nodes_from(isolated_nodes)
+        # Reuse the graph built on an earlier run if the shapefile is unchanged
+        cache_key = hashlib.sha1(
+            (os.path.abspath(shapefile_path) + str(os.path.getmtime(shapefile_path))).encode()
+        ).hexdigest()
+        cache_path = os.path.join(GRAPH_CACHE_DIR, f"{cache_key}.pkl")
+
+        graph = None
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    graph = pickle.load(f)
+                print(f"  Loading {shapefile_path} (cached)...")
+            except (OSError, pickle.UnpicklingError, EOFError):
+                graph = None  # Unreadable cache, rebuild it
+
+        if graph is None:
+            print(f"  Loading {shapefile_path}...")
+            graph = Graph.from_file(shapefile_path)
+
+            # Remove isolated nodes
+            isolated_nodes = [node for node, degree in graph.degree() if degree == 0]
+            if isolated_nodes:
+                graph.remove_nodes_from(isolated_nodes)
+
+            # Cache the data columns already converted to numbers
+            columns = detect_data_columns(graph)
+            if columns:
+                coerce_columns(graph, (columns['population'], columns['dem'], columns['rep']))
+
+            os.makedirs(GRAPH_CACHE_DIR, exist_ok=True)
+            # Write under a temporary name so parallel runs never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
 
         print(f"  Loaded {len(graph.nodes)} precincts")
         return graph
@@ -136,24 +182,27 @@ def detect_data_columns(graph):
     if not graph.nodes:
         return None
 
-    sample_node = list(graph.nodes())[0]
+    sample_node = next(iter(graph.nodes))
     node_data = graph.nodes[sample_node]
     columns = list(node_data.keys())
 
+    cols_upper = [col.upper() for col in columns]
+
     result = {'population': None, 'dem': None, 'rep': None}
 
     # Find population column
     pop_candidates = ['TOTPOP', 'POP', 'POPULATION', 'TOT_POP', 'PERSONS']
-    for col in columns:
-        if any(cand in col.upper() for cand in pop_candidates):
-            result['population'] = col
-            break
+    pop_rx = re.compile("|".join(map(re.escape, pop_candidates)))
+    result['population'] = next(
+        (col for col, col_upper in zip(columns, cols_upper) if pop_rx.search(col_upper)), None
+    )
 
     # Find election columns (prioritize presidential, then senate, then governor)
     election_types = ['PRES', 'SEN', 'GOV', 'USS', 'ATG']
 
     for election_type in election_types:
-        dem_candidates = [c for c in columns if election_type in c.upper() and 'D' in c.upper()]
+        dem_candidates = [col for col, col_upper in zip(columns, cols_upper)
+                          if election_type in col_upper and 'D' in col_upper]
         if dem_candidates:
             dem_col = dem_candidates[0]
             # Try to find corresponding Republican column
@@ -172,6 +221,29 @@ def detect_data_columns(graph):
     return result if result['population'] and result['dem'] and result['rep'] else None
 
 
+def coerce_columns(graph, cols):
+    """
+    Make node attributes numeric in place
+
+    Strings are converted to numbers and anything unparseable or missing
+    becomes 0. Counts are whole people/votes, so they are rounded and stored
+    as integers. The converted columns are recorded in
+    ``graph.graph["coerced_columns"]``.
+
+    Args:
+        graph: GerryChain graph
+        cols (tuple): Attribute names
+    """
+    nodes = list(graph.nodes())
+    node_data = [graph.nodes[node] for node in nodes]
+    data = pd.DataFrame({col: [d.get(col) for d in node_data] for col in cols})
+    data = data.apply(pd.to_numeric, errors='coerce').fillna(0).round().astype(np.int32)
+
+    for col in data.columns:
+        nx.set_node_attributes(graph, dict(zip(nodes, data[col].tolist())), col)
+    graph.graph["coerced_columns"] = tuple(cols)
+
+
 def create_initial_partition(graph, columns, num_districts=5):
     """
     Create initial district partition
@@ -189,32 +261,12 @@ def create_initial_partition(graph, columns, num_districts=5):
         dem_col = columns['dem']
         rep_col = columns['rep']
 
-        # Ensure all data is numeric (convert strings to numbers)
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-
-            # Convert population to numeric
-            if pop_col in node_data:
-                try:
-                    node_data[pop_col] = float(node_data[pop_col])
-                except (ValueError, TypeError):
-                    node_data[pop_col] = 0
-
-            # Convert dem votes to numeric
-            if dem_col in node_data:
-                try:
-                    node_data[dem_col] = float(node_data[dem_col])
-                except (ValueError, TypeError):
-                    node_data[dem_col] = 0
-
-            # Convert rep votes to numeric
-            if rep_col in node_data:
-                try:
-                    node_data[rep_col] = float(node_data[rep_col])
-                except (ValueError, TypeError):
-                    node_data[rep_col] = 0
-
-        total_pop = sum(graph.nodes[node].get(pop_col, 0) for node in graph.nodes())
+        # Ensure all data is numeric, unless a cached graph already is
+        cols = (pop_col, dem_col, rep_col)
+        if not set(cols) <= set(graph.graph.get("coerced_columns", ())):
+            coerce_columns(graph, cols)
+
+        total_pop = sum(data[pop_col] for _, data in graph.nodes(data=True))
         target_pop = total_pop / num_districts
 
         # Create partition with recursive tree
@@ -235,6 +287,10 @@ def create_initial_partition(graph, columns, num_districts=5):
         }
 
         partition = Partition(graph, assignment, updaters)
+
+        # Build the adjacency the ensemble kernel walks once, up front
+        graph.graph["csr"] = graph_to_csr(graph)
+
         return partition
 
     except Exception as e:
@@ -242,42 +298,222 @@ def create_initial_partition(graph, columns, num_districts=5):
         return None
 
 
-def run_ensemble(initial_partition, num_steps=500):
+def draw_tree_seeds(graph, pop_col, target_pop, num_districts, count, fallback,
+                    max_attempts=20):
+    """
+    Draw independent starting maps for extra MCMC chains
+
+    Each map is cut from its own random spanning tree, so chains started
+    from them begin spread across the space of plans instead of all at
+    the initial map, and need less burn-in to cover it.
+
+    Args:
+        graph: GerryChain graph
+        pop_col (str): Population column
+        target_pop (float): Target population per district
+        num_districts (int): Number of districts
+        count (int): Number of maps to draw
+        fallback: Assignment to start from when a map cannot be drawn
+            within ``max_attempts`` tries
+        max_attempts (int): Tree draws to try per map
+
+    Returns:
+        list: Assignments
+    """
+    seeds = []
+    for _ in range(count):
+        for _ in range(max_attempts):
+            try:
+                seeds.append(recursive_tree_part(
+                    graph, range(num_districts), target_pop, pop_col, epsilon=0.30
+                ))
+                break
+            except Exception:
+                continue
+        else:
+            print("  Warning: could not draw a starting map, reusing the initial one")
+            seeds.append(fallback)
+    return seeds
+
+
+def graph_to_csr(graph):
+    """
+    Adjacency of the graph in int32 CSR form (``indptr``, ``indices``), with
+    nodes numbered by their position in ``graph.nodes()``
+    """
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=list(graph.nodes()), format="csr")
+    return adjacency.indptr.astype(np.int32), adjacency.indices.astype(np.int32)
+
+
+@njit(cache=True, nogil=True)
+def mcmc_kernel(indptr, indices, assign, dem, rep, k, steps, seed):
+    """
+    Single-flip MCMC chain on flat arrays, returning the number of
+    Democratic district wins at each of ``steps`` states (the first being
+    the initial map)
+
+    Mirrors ``propose_random_flip`` with ``single_flip_contiguous`` and an
+    always-accept rule: pick a cut edge uniformly, flip one of its endpoints
+    into the other's district, and retry until the flipped node's old
+    district stays connected. ``assign`` is updated in place.
+    """
+    np.random.seed(seed)
+    n = assign.shape[0]
+
+    dem_sum = np.zeros(k, dtype=np.int64)
+    rep_sum = np.zeros(k, dtype=np.int64)
+    for v in range(n):
+        dem_sum[assign[v]] += dem[v]
+        rep_sum[assign[v]] += rep[v]
+
+    out = np.empty(steps, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.int8)
+    queue = np.empty(n, dtype=np.int64)
+    targets = np.empty(n, dtype=np.int64)
+
+    for step in range(steps):
+        if step > 0:
+            while True:
+                # Uniform random cut edge (each undirected edge counted once)
+                num_cut = 0
+                for u in range(n):
+                    for e in range(indptr[u], indptr[u + 1]):
+                        if u < indices[e] and assign[u] != assign[indices[e]]:
+                            num_cut += 1
+                if num_cut == 0:
+                    break
+                r = np.random.randint(0, num_cut)
+                edge_u = -1
+                edge_v = -1
+                for u in range(n):
+                    for e in range(indptr[u], indptr[u + 1]):
+                        if u < indices[e] and assign[u] != assign[indices[e]]:
+                            if r == 0:
+                                edge_u = u
+                                edge_v = indices[e]
+                            r -= 1
+                    if edge_u >= 0:
+                        break
+                if np.random.randint(0, 2) == 0:
+                    node, other = edge_u, edge_v
+                else:
+                    node, other = edge_v, edge_u
+                old = assign[node]
+                new = assign[other]
+
+                # The old district must keep a neighbor of the flipped node...
+                num_targets = 0
+                for e in range(indptr[node], indptr[node + 1]):
+                    if assign[indices[e]] == old:
+                        targets[num_targets] = indices[e]
+                        num_targets += 1
+                if num_targets == 0:
+                    continue
+
+                # ...and those neighbors must stay connected without it
+                visited[:] = 0
+                visited[node] = 1
+                visited[targets[0]] = 1
+                head = 0
+                tail = 1
+                queue[0] = targets[0]
+                while head < tail:
+                    v = queue[head]
+                    head += 1
+                    for e in range(indptr[v], indptr[v + 1]):
+                        w = indices[e]
+                        if visited[w] == 0 and assign[w] == old:
+                            visited[w] = 1
+                            queue[tail] = w
+                            tail += 1
+                connected = True
+                for t in range(num_targets):
+                    if visited[targets[t]] == 0:
+                        connected = False
+                        break
+                if not connected:
+                    continue
+
+                assign[node] = new
+                dem_sum[old] -= dem[node]
+                dem_sum[new] += dem[node]
+                rep_sum[old] -= rep[node]
+                rep_sum[new] += rep[node]
+                break
+
+        wins = 0
+        for d in range(k):
+            if dem_sum[d] > rep_sum[d]:
+                wins += 1
+        out[step] = wins
+
+    return out
+
+
+def run_ensemble(initial_partition, num_steps=500, num_chains=1, start_assignments=None):
     """
     Run MCMC ensemble
 
+    The chain runs in ``mcmc_kernel`` on a CSR adjacency and flat
+    assignment/vote arrays; GerryChain is only used to build the initial
+    partition. The steps are split across ``num_chains`` independent chains
+    from the same starting map, run on threads (the compiled kernel
+    releases the GIL) and pooled into one ensemble.
+
     Args:
         initial_partition: Starting partition
-        num_steps (int): Number of steps
+        num_steps (int): Total number of steps across all chains
+        num_chains (int): Number of independent chains
+        start_assignments (list): Optional starting maps for the chains after
+            the first (see ``draw_tree_seeds``); by default every chain starts
+            from the initial partition
 
     Returns:
         list: Democratic district wins for each step
     """
     try:
-        chain = MarkovChain(
-            proposal=propose_random_flip,
-            constraints=[single_flip_contiguous],
-            accept=lambda x: True,
-            initial_state=initial_partition,
-            total_steps=num_steps
-        )
-
-        dem_wins_list = []
-        for partition in chain:
-            dem_wins = sum(
-                1 for district in partition.parts.keys()
-                if partition["dem_votes"][district] > partition["rep_votes"][district]
+        graph = initial_partition.graph.graph
+        nodes = list(graph.nodes())
+        if "csr" not in graph.graph:
+            graph.graph["csr"] = graph_to_csr(graph)
+        indptr, indices = graph.graph["csr"]
+
+        # Districts are renumbered 0..k-1 for the kernel
+        districts = sorted(initial_partition.parts.keys())
+        index_of = {district: i for i, district in enumerate(districts)}
+        starts = [initial_partition.assignment] + list(start_assignments or [])
+        assigns = [
+            np.fromiter((index_of[start[node]] for node in nodes), dtype=np.int32, count=len(nodes))
+            for start in starts
+        ]
+
+        # create_initial_partition has already made the votes integers
+        dem_col = initial_partition.updaters["dem_votes"].fields[0]
+        rep_col = initial_partition.updaters["rep_votes"].fields[0]
+        node_data = [graph.nodes[node] for node in nodes]
+        dem = np.array([d[dem_col] for d in node_data], dtype=np.int32)
+        rep = np.array([d[rep_col] for d in node_data], dtype=np.int32)
+
+        steps_per_chain = max(num_steps // num_chains, 1)
+        seeds = [random.randrange(2**31) for _ in range(num_chains)]
+
+        def run_chain(chain):
+            return mcmc_kernel(
+                indptr, indices, assigns[chain % len(assigns)].copy(), dem, rep,
+                len(districts), steps_per_chain, seeds[chain]
             )
-            dem_wins_list.append(dem_wins)
 
-        return dem_wins_list
+        with ThreadPoolExecutor(max_workers=num_chains) as executor:
+            chains = list(executor.map(run_chain, range(num_chains)))
+
+        return np.concatenate(chains).tolist()
 
     except Exception as e:
         print(f"  ERROR running ensemble: {str(e)}")
         return None
 
 
-def analyze_state(state_name, shapefile_path, num_districts=5, num_steps=500):
+def analyze_state(state_name, shapefile_path, num_districts=5, num_steps=500, num_chains=1):
     """
     Run full gerrymandering detection for a state
 
@@ -286,6 +522,7 @@ def analyze_state(state_name, shapefile_path, num_districts=5, num_steps=500):
         shapefile_path (str): Path to shapefile
         num_districts (int): Number of districts to create
         num_steps (int): MCMC steps
+        num_chains (int): Independent MCMC chains to split the steps across
 
     Returns:
         dict: Analysis results or None on error
@@ -312,22 +549,33 @@ def analyze_state(state_name, shapefile_path, num_districts=5, num_steps=500):
     if not partition:
         return None
 
-    # Calculate initial statistics
-    initial_dem_wins = sum(
-        1 for district in partition.parts.keys()
-        if partition["dem_votes"][district] > partition["rep_votes"][district]
-    )
+    # Calculate initial statistics from the district tallies in one pass
+    dem_votes = partition["dem_votes"]
+    rep_votes = partition["rep_votes"]
+    districts = list(partition.parts.keys())
+    dem = np.array([dem_votes[d] for d in districts], dtype=np.int64)
+    rep = np.array([rep_votes[d] for d in districts], dtype=np.int64)
 
-    total_dem = sum(partition["dem_votes"].values())
-    total_rep = sum(partition["rep_votes"].values())
+    initial_dem_wins = int(np.count_nonzero(dem > rep))
+    total_dem = int(dem.sum())
+    total_rep = int(rep.sum())
     dem_vote_share = total_dem / (total_dem + total_rep) * 100
 
     print(f"  Initial map: {initial_dem_wins}/{num_districts} DEM districts")
     print(f"  Statewide vote share: {dem_vote_share:.1f}% DEM")
 
+    # Extra chains start from their own tree-drawn maps
+    start_assignments = None
+    if num_chains > 1:
+        target_pop = sum(partition["population"].values()) / num_districts
+        start_assignments = draw_tree_seeds(
+            graph, columns['population'], target_pop, num_districts, num_chains - 1,
+            partition.assignment
+        )
+
     # Run ensemble
     print(f"  Running {num_steps}-step MCMC ensemble...")
-    dem_wins_list = run_ensemble(partition, num_steps)
+    dem_wins_list = run_ensemble(partition, num_steps, num_chains, start_assignments)
     if not dem_wins_list:
         return None
 
@@ -393,10 +641,10 @@ def main():
     print(f"\nFound {len(state_dirs)} states to analyze")
 
     # Process each state
-    results = []
     successful = 0
     failed = 0
 
+    shapefiles = []
     for state_dir in state_dirs:
         state_path = os.path.join(data_dir, state_dir)
         shapefile = find_shapefile(state_path)
@@ -406,17 +654,47 @@ def main():
             failed += 1
             continue
 
-        # Determine appropriate number of districts based on state size
-        # Use fewer districts for smaller states
-        num_districts = 5  # Default
+        shapefiles.append((state_dir, shapefile))
 
-        result = analyze_state(state_dir, shapefile, num_districts=num_districts, num_steps=500)
+    # Determine appropriate number of districts based on state size
+    # Use fewer districts for smaller states
+    num_districts = 5  # Default
 
-        if result:
-            results.append(result)
-            successful += 1
-        else:
-            failed += 1
+    # States get one core each; cores left over when there are fewer states
+    # than cores run extra chains within each state
+    num_chains = max(1, (os.cpu_count() or 1) // max(len(shapefiles), 1))
+    tasks = [
+        (state_dir, shapefile, num_districts, 500, num_chains)
+        for state_dir, shapefile in shapefiles
+    ]
+
+    # Workers load shapefiles while other workers run their chains, so start
+    # the biggest states first; small ones then fill in at the end instead
+    # of one large load and chain running alone after everything else
+    tasks.sort(key=lambda task: os.path.getsize(task[1]), reverse=True)
+
+    # States are independent, so analyze them in parallel, one per core.
+    # Each result is appended to an NDJSON file as soon as its state
+    # finishes, so a crash part-way through keeps the completed states.
+    output_base = f"gerrymandering_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    ndjson_file = f"{output_base}.ndjson"
+
+    with open(ndjson_file, 'w') as fh, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(analyze_state, *task) for task in tasks]
+
+        for future in as_completed(futures):
+            result = future.result()
+
+            if result:
+                fh.write(json.dumps(result) + "\n")
+                fh.flush()
+                successful += 1
+            else:
+                failed += 1
+
+    # Report states in name order regardless of completion order
+    with open(ndjson_file) as fh:
+        results = sorted((json.loads(line) for line in fh), key=lambda r: r['state'])
 
     # Generate summary report
     print("\n" + "="*70)
@@ -427,31 +705,28 @@ def main():
     print(f"Failed: {failed}")
 
     if results:
-        # Create DataFrame for analysis
-        df = pd.DataFrame(results)
-
         # Count suspicious states
-        suspicious_states = df[df['is_outlier'] == True]
+        suspicious_states = [r for r in results if r['is_outlier']]
         print(f"\n⚠️  States with suspicious patterns: {len(suspicious_states)}")
 
         if len(suspicious_states) > 0:
             print("\nStates flagged as potential gerrymanders:")
-            for _, row in suspicious_states.iterrows():
+            for row in suspicious_states:
                 direction = "PRO-DEM" if row['percentile'] > 50 else "PRO-REP"
-                print(f"  - {row['state'].upper()}: {row['percentile']:.1f}% percentile ({direction})")
+                print(f"  - {row['state'].upper()}: "
+                      f"{row['percentile']:.1f}% percentile ({direction})")
 
         # Show top 10 most extreme
         print("\nTop 10 most extreme outliers:")
-        df['extremeness'] = df['percentile'].apply(lambda x: abs(x - 50))
-        top_outliers = df.nlargest(10, 'extremeness')
+        top_outliers = sorted(results, key=lambda r: abs(r['percentile'] - 50), reverse=True)[:10]
 
-        for _, row in top_outliers.iterrows():
+        for row in top_outliers:
             direction = "PRO-DEM" if row['percentile'] > 50 else "PRO-REP"
             flag = "⚠️" if row['is_outlier'] else "  "
             print(f"  {flag} {row['state']:20s} {row['percentile']:5.1f}% percentile ({direction})")
 
         # Save detailed results
-        output_file = f"gerrymandering_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        output_file = f"{output_base}.json"
         with open(output_file, 'w') as f:
             json.dump(results, f, indent=2)
 
@@ -459,8 +734,11 @@ def main():
 
         # Save CSV for easy analysis
         csv_file = output_file.replace('.json', '.csv')
+        df = pd.DataFrame(results)
+        df['extremeness'] = (df['percentile'] - 50).abs()
         df.to_csv(csv_file, index=False)
         print(f"💾 CSV report saved to: {csv_file}")
+        print(f"💾 Per-state results streamed to: {ndjson_file}")
 
     print(f"\n✅ Analysis complete at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -7,7 +7,7 @@ This script loads real Alaska data from MGGG and uses the existing district
 assignments to demonstrate working with real election data.
 """
 
-import pandas as pd
+import numpy as np
 from gerrychain import Graph, Partition, MarkovChain
 from gerrychain.proposals import propose_random_flip
 from gerrychain.constraints import single_flip_contiguous
@@ -15,6 +15,47 @@ from gerrychain.updaters import cut_edges, Tally
 import os
 
 
+class ArrayTally:
+    """
+    Updater that tallies a node attribute per district into an int64 NumPy
+    array ordered like ``districts``, instead of a dict keyed by district
+
+    The attribute is read once into an int32 array aligned with the graph's
+    nodes (NaN counts as zero), and each partition's totals come from its
+    parent's by moving only the flipped nodes' values.
+    """
+
+    def __init__(self, graph, field, districts, alias):
+        self.alias = alias
+        self.districts = list(districts)
+        self.index_of = {district: i for i, district in enumerate(self.districts)}
+        self.node_index = {node: i for i, node in enumerate(graph.nodes)}
+        values = np.array([data[field] for _, data in graph.nodes(data=True)], dtype=np.float64)
+        self.values = np.nan_to_num(values).round().astype(np.int32)
+
+    def __call__(self, partition):
+        parent = partition.parent
+        if parent is None:
+            assignment = partition.assignment
+            parts = np.fromiter((self.index_of[assignment[node]] for node in self.node_index),
+                                dtype=np.int64, count=len(self.node_index))
+            tally = np.zeros(len(self.districts), dtype=np.int64)
+            np.add.at(tally, parts, self.values)
+            return tally
+
+        flips = partition.flips
+        nodes = np.fromiter((self.node_index[node] for node in flips), dtype=np.int64,
+                            count=len(flips))
+        old_parts = np.fromiter((self.index_of[parent.assignment[node]] for node in flips),
+                                dtype=np.int64, count=len(flips))
+        new_parts = np.fromiter((self.index_of[district] for district in flips.values()),
+                                dtype=np.int64, count=len(flips))
+        tally = parent[self.alias].copy()
+        np.subtract.at(tally, old_parts, self.values[nodes])
+        np.add.at(tally, new_parts, self.values[nodes])
+        return tally
+
+
 def load_real_data(shapefile_path):
     """
     Load real MGGG data from shapefile
@@ -38,14 +79,14 @@ def load_real_data(shapefile_path):
     print(f"✅ Loaded graph with {initial_nodes} precincts")
 
     # Remove isolated nodes (islands) that can cause contiguity issues
-    isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+    isolated_nodes = [node for node, degree in graph.degree() if degree == 0]
     if isolated_nodes:
         print(f"   ⚠️  Removing {len(isolated_nodes)} isolated precincts...")
         graph.remove_nodes_from(isolated_nodes)
         print(f"   ✅ Graph now has {len(graph.nodes)} connected precincts")
 
     # Display available data columns
-    sample_node = list(graph.nodes())[0]
+    sample_node = next(iter(graph.nodes))
     print(f"\n📊 Available data columns (first 10):")
     for i, key in enumerate(list(graph.nodes[sample_node].keys())[:10]):
         print(f"   - {key}")
@@ -66,28 +107,30 @@ def create_partition_from_existing_districts(graph):
     print(f"\n🗺️  Using existing district assignments from data...")
 
     # Use the HDIST column (House Districts) from the data
-    assignment = {node: graph.nodes[node]["HDIST"] for node in graph.nodes()}
+    assignment = {node: data["HDIST"] for node, data in graph.nodes(data=True)}
 
     # Count unique districts
     unique_districts = set(assignment.values())
     print(f"   Found {len(unique_districts)} existing districts")
 
-    # Set up updaters for tracking metrics
+    # Set up updaters for tracking metrics; votes are arrays in sorted
+    # district order
+    districts = sorted(unique_districts)
     updaters = {
         "cut_edges": cut_edges,
         "population": Tally("TOTPOP", alias="population"),
-        "pres16_dem": Tally("PRES16D", alias="pres16_dem"),
-        "pres16_rep": Tally("PRES16R", alias="pres16_rep"),
+        "pres16_dem": ArrayTally(graph, "PRES16D", districts, alias="pres16_dem"),
+        "pres16_rep": ArrayTally(graph, "PRES16R", districts, alias="pres16_rep"),
     }
 
     partition = Partition(graph, assignment, updaters)
 
     # Display district info (sample first 10)
     print("\n✅ District information (first 10):")
-    for i, district_id in enumerate(sorted(partition.parts.keys())[:10]):
+    dem_votes = partition["pres16_dem"]
+    rep_votes = partition["pres16_rep"]
+    for district_id, dem, rep in zip(districts[:10], dem_votes, rep_votes):
         pop = partition["population"][district_id]
-        dem = partition["pres16_dem"][district_id]
-        rep = partition["pres16_rep"][district_id]
         winner = "DEM" if dem > rep else "REP"
         print(f"   District {district_id}: {pop:,} people | {dem:,} vs {rep:,} → {winner}")
 
@@ -106,31 +149,24 @@ def analyze_real_data(partition):
     print(f"\n📊 Analyzing Real Election Data (2016 Presidential)...")
     print("=" * 60)
 
-    total_dem = sum(partition["pres16_dem"].values())
-    total_rep = sum(partition["pres16_rep"].values())
+    dem = partition["pres16_dem"]
+    rep = partition["pres16_rep"]
+
+    total_dem = dem.sum()
+    total_rep = rep.sum()
     total_votes = total_dem + total_rep
 
     dem_pct = (total_dem / total_votes) * 100
     rep_pct = (total_rep / total_votes) * 100
 
     print(f"\nStatewide vote:")
-    print(f"   Democrat: {total_dem:,} ({dem_pct:.1f}%)")
-    print(f"   Republican: {total_rep:,} ({rep_pct:.1f}%)")
+    print(f"   Democrat: {total_dem:,.0f} ({dem_pct:.1f}%)")
+    print(f"   Republican: {total_rep:,.0f} ({rep_pct:.1f}%)")
 
     # Count districts won by each party
-    dem_districts = 0
-    rep_districts = 0
-
-    for district_id in partition.parts.keys():
-        dem_votes = partition["pres16_dem"][district_id]
-        rep_votes = partition["pres16_rep"][district_id]
-
-        if dem_votes > rep_votes:
-            dem_districts += 1
-        else:
-            rep_districts += 1
-
-    total_districts = len(partition.parts)
+    total_districts = len(dem)
+    dem_districts = int(np.count_nonzero(dem > rep))
+    rep_districts = total_districts - dem_districts
     print(f"\nDistrict outcomes:")
     print(f"   Democrat wins: {dem_districts}/{total_districts} ({dem_districts/total_districts*100:.1f}%)")
     print(f"   Republican wins: {rep_districts}/{total_districts} ({rep_districts/total_districts*100:.1f}%)")
@@ -176,11 +212,8 @@ def run_mcmc_ensemble(initial_partition, num_steps=100):
 
     for i, partition in enumerate(chain):
         # Count Democratic wins
-        dem_wins = sum(
-            1 for district in partition.parts.keys()
-            if partition["pres16_dem"][district] > partition["pres16_rep"][district]
-        )
-        dem_wins_list.append(dem_wins)
+        dem_wins = np.count_nonzero(partition["pres16_dem"] > partition["pres16_rep"])
+        dem_wins_list.append(int(dem_wins))
 
         if (i + 1) % 20 == 0:
             print(f"   Step {i + 1}/{num_steps}")
@@ -202,22 +235,25 @@ def analyze_ensemble_results(dem_wins_list, initial_partition):
     print("=" * 60)
 
     # Calculate initial Democratic wins
-    initial_dem_wins = sum(
-        1 for district in initial_partition.parts.keys()
-        if initial_partition["pres16_dem"][district] > initial_partition["pres16_rep"][district]
-    )
+    initial_dem_wins = int(np.count_nonzero(
+        initial_partition["pres16_dem"] > initial_partition["pres16_rep"]
+    ))
 
-    df = pd.DataFrame({"dem_districts": dem_wins_list})
+    wins = np.asarray(dem_wins_list, dtype=np.int32)
+    counts = np.bincount(wins)
+    lo, hi = wins.min(), wins.max()
 
     print(f"\nOriginal map: Democrats win {initial_dem_wins} districts")
     print(f"\nIn {len(dem_wins_list)} alternative maps:")
-    print(f"   Average: {df['dem_districts'].mean():.1f} districts")
-    print(f"   Range: {df['dem_districts'].min()}-{df['dem_districts'].max()} districts")
+    print(f"   Average: {wins.mean():.1f} districts")
+    print(f"   Range: {lo}-{hi} districts")
 
     # Show distribution
     print(f"\n📊 Distribution:")
-    value_counts = df['dem_districts'].value_counts().sort_index()
-    for districts, count in value_counts.items():
+    for districts in range(lo, hi + 1):
+        count = counts[districts]
+        if count == 0:
+            continue
         percentage = (count / len(dem_wins_list)) * 100
         bar = "█" * int(percentage / 5)
         print(f"   {int(districts)} districts: {count:3d} ({percentage:5.1f}%) {bar}")
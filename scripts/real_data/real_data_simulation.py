@@ -11,14 +11,32 @@ Data source: MGGG States - Alaska Shapefiles
 https://github.com/mggg-states/AK-shapefiles
 """
 
+import hashlib
 import matplotlib.pyplot as plt
-import pandas as pd
-from gerrychain import Graph, Partition, MarkovChain
-from gerrychain.proposals import propose_random_flip
-from gerrychain.constraints import single_flip_contiguous
+import multiprocessing as mp
+import networkx as nx
+import numpy as np
+from gerrychain import Graph, Partition
 from gerrychain.updaters import cut_edges, Tally
 from gerrychain.tree import recursive_tree_part
 import os
+import pickle
+import random
+import re
+
+# Numba is optional: without it the contiguity kernel below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Initial district assignments are pickled here, keyed by shapefile and
+# partitioning parameters
+ASSIGNMENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gerrychain_fra")
 
 
 def load_real_data(shapefile_path):
@@ -39,19 +57,25 @@ def load_real_data(shapefile_path):
 
     # Load the shapefile into a GerryChain graph
     graph = Graph.from_file(shapefile_path)
+    # Remember where the graph came from so derived results can be cached
+    graph.graph["source"] = (os.path.abspath(shapefile_path), os.path.getmtime(shapefile_path))
 
     initial_nodes = len(graph.nodes)
     print(f"✅ Loaded graph with {initial_nodes} precincts")
 
     # Remove isolated nodes (islands) that can cause contiguity issues
-    isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+    nodes = list(graph.nodes)
+    indptr, _ = graph_to_csr(graph)
+    isolated_nodes = [nodes[i] for i in np.flatnonzero(np.diff(indptr) == 0)]
     if isolated_nodes:
         print(f"   ⚠️  Removing {len(isolated_nodes)} isolated precincts...")
         graph.remove_nodes_from(isolated_nodes)
+        # Keep node ids dense so they can index the column arrays
+        graph = nx.convert_node_labels_to_integers(graph)
         print(f"   ✅ Graph now has {len(graph.nodes)} connected precincts")
 
     # Display available data columns
-    sample_node = list(graph.nodes())[0]
+    sample_node = next(iter(graph.nodes))
     print(f"\n📊 Available data columns:")
     for key in graph.nodes[sample_node].keys():
         print(f"   - {key}")
@@ -59,30 +83,94 @@ def load_real_data(shapefile_path):
     return graph
 
 
-def analyze_data(graph):
+def node_column(graph, col):
+    """
+    Values of a node attribute as an int64 array indexed by node id
+
+    Args:
+        graph: A graph whose nodes are numbered 0..n-1
+        col (str): Name of the node attribute (missing values count as 0)
+
+    Returns:
+        np.ndarray: The column, one entry per node
+    """
+    n = len(graph.nodes)
+    return np.fromiter((graph.nodes[i].get(col, 0) for i in range(n)), dtype=np.int64, count=n)
+
+
+def node_columns(graph, cols):
+    """
+    Values of several node attributes as an int64 array of shape
+    (nodes, len(cols)), read in a single pass over the nodes
+
+    Args:
+        graph: A graph whose nodes are numbered 0..n-1
+        cols (list): Names of the node attributes (missing values count as 0)
+
+    Returns:
+        np.ndarray: One row per node, one column per attribute
+    """
+    rows = [[data.get(col, 0) for col in cols] for _, data in graph.nodes(data=True)]
+    return np.array(rows, dtype=np.int64).reshape(len(rows), len(cols))
+
+
+# Every column-name token we classify on; the lookahead also finds overlapping
+# matches so e.g. "REPOP" reports both REP and POP
+COLUMN_TOKENS = re.compile(r'(?=(POP|DEM|REP|GOV|SEN|PRES))', re.IGNORECASE)
+
+
+def classify_columns(node_data):
+    """
+    Sort a node's attribute names into population and election columns
+
+    Args:
+        node_data (dict): Attributes of a sample node
+
+    Returns:
+        tuple: (pop_cols, voting_cols, election_cols), where voting_cols have
+            any party or office marker and election_cols are the office
+            columns whose names contain a 'D' (the Democratic candidates)
+    """
+    pop_cols = []
+    voting_cols = []
+    election_cols = []
+
+    for key in node_data.keys():
+        tokens = {token.upper() for token in COLUMN_TOKENS.findall(key)}
+        if not tokens:
+            continue
+        if 'POP' in tokens:
+            pop_cols.append(key)
+        if tokens - {'POP'}:
+            voting_cols.append(key)
+        if tokens & {'GOV', 'SEN', 'PRES'} and 'D' in key.upper():
+            election_cols.append(key)
+
+    return pop_cols, voting_cols, election_cols
+
+
+def analyze_data(graph, columns=None):
     """
     Analyze the loaded real data
 
     Args:
         graph: The loaded graph
+        columns (tuple): Result of classify_columns, computed from a sample
+            node when not given
     """
     print(f"\n🔍 Analyzing real data...")
 
-    total_population = 0
-    voting_columns = []
-
     # Find population and voting data columns
-    sample_node = list(graph.nodes())[0]
-    node_data = graph.nodes[sample_node]
-
-    for key in node_data.keys():
-        if 'POP' in key.upper() or 'TOTPOP' in key.upper():
-            total_population = sum(graph.nodes[node].get(key, 0) for node in graph.nodes())
-            print(f"   Population column: {key}")
-            print(f"   Total population: {total_population:,}")
+    if columns is None:
+        sample_node = next(iter(graph.nodes))
+        columns = classify_columns(graph.nodes[sample_node])
+    pop_cols, voting_columns, _ = columns
 
-        if any(x in key.upper() for x in ['DEM', 'REP', 'GOV', 'SEN', 'PRES']):
-            voting_columns.append(key)
+    # Total every population column in one pass over the nodes
+    pop_sums = node_columns(graph, pop_cols).sum(axis=0)
+    for key, total_population in zip(pop_cols, pop_sums):
+        print(f"   Population column: {key}")
+        print(f"   Total population: {total_population:,}")
 
     if voting_columns:
         print(f"\n   Found {len(voting_columns)} voting data columns:")
@@ -92,14 +180,21 @@ def analyze_data(graph):
     return voting_columns
 
 
-def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
+def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP", columns=None):
     """
     Create initial district partition from real data
 
+    The tree-drawn assignment is cached in ASSIGNMENT_CACHE_DIR per
+    shapefile, modification time, district count, population column and
+    epsilon, so repeated runs on an unchanged shapefile start from the same
+    plan rather than from an independent random draw.
+
     Args:
         graph: The loaded graph
         num_districts (int): Number of districts to create
         pop_col (str): Name of the population column
+        columns (tuple): Result of classify_columns, computed from a sample
+            node when not given
 
     Returns:
         Partition: Initial partition
@@ -107,7 +202,8 @@ def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
     print(f"\n🗺️  Creating {num_districts} districts from real data...")
 
     # Calculate target population
-    total_pop = sum(graph.nodes[node].get(pop_col, 0) for node in graph.nodes())
+    pop = node_column(graph, pop_col)
+    total_pop = pop.sum()
     target_pop = total_pop / num_districts
 
     print(f"   Total population: {total_pop:,}")
@@ -115,16 +211,44 @@ def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
 
     # Create initial partition using recursive tree partitioning
     # Use higher epsilon for more flexibility with real-world data
-    assignment = recursive_tree_part(
-        graph,
-        range(num_districts),
-        target_pop,
-        pop_col,
-        epsilon=0.25  # 25% deviation allowed for flexibility
-    )
+    epsilon = 0.25  # 25% deviation allowed for flexibility
+
+    # Reuse the assignment from an earlier run on the same shapefile
+    cache_path = None
+    source = graph.graph.get("source")
+    if source is not None:
+        cache_key = hashlib.sha1(
+            f"{source[0]}-{source[1]}-{num_districts}-{pop_col}-{epsilon}".encode()
+        ).hexdigest()
+        cache_path = os.path.join(ASSIGNMENT_CACHE_DIR, f"{cache_key}.pkl")
+
+    assignment = None
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                assignment = pickle.load(f)
+            print("   Using cached initial assignment")
+        except (OSError, pickle.UnpicklingError, EOFError):
+            assignment = None  # Unreadable cache, draw a new plan
+
+    if assignment is None:
+        assignment = recursive_tree_part(
+            graph,
+            range(num_districts),
+            target_pop,
+            pop_col,
+            epsilon=epsilon
+        )
+        if cache_path is not None:
+            os.makedirs(ASSIGNMENT_CACHE_DIR, exist_ok=True)
+            # Write under a temporary name so parallel runs never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(assignment, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
 
     # Find available election columns
-    sample_node = list(graph.nodes())[0]
+    sample_node = next(iter(graph.nodes))
     node_data = graph.nodes[sample_node]
 
     # Set up updaters for tracking metrics
@@ -134,11 +258,13 @@ def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
     }
 
     # Add election updaters if data exists
-    election_cols = [k for k in node_data.keys() if any(x in k.upper() for x in ['GOV', 'SEN', 'PRES']) and 'D' in k.upper()]
+    if columns is None:
+        columns = classify_columns(node_data)
+    election_cols = columns[2]
 
     if election_cols:
         # Use the first found election column
-        dem_col = [c for c in election_cols if 'D' in c.upper()][0]
+        dem_col = election_cols[0]
         rep_col = dem_col.replace('D', 'R') if 'D' in dem_col else None
 
         if rep_col and rep_col in node_data:
@@ -150,13 +276,20 @@ def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
 
     # Display initial districts
     print("\n✅ Initial districts created:")
+    has_election_data = "dem_votes" in partition.updaters
+    assignment_arr = np.fromiter((assignment[i] for i in range(len(pop))),
+                                 dtype=np.int64, count=len(pop))
+    district_pop_arr = np.bincount(assignment_arr, weights=pop,
+                                   minlength=num_districts).astype(np.int64)
+    if has_election_data:
+        dv = partition["dem_votes"]
+        rv = partition["rep_votes"]
     for district_id in sorted(partition.parts.keys()):
-        pop = partition["population"][district_id]
-        print(f"   District {district_id}: {pop:,} people", end="")
+        print(f"   District {district_id}: {district_pop_arr[district_id]:,} people", end="")
 
-        if "dem_votes" in partition.updaters:
-            dem = partition["dem_votes"][district_id]
-            rep = partition["rep_votes"][district_id]
+        if has_election_data:
+            dem = dv[district_id]
+            rep = rv[district_id]
             winner = "DEM" if dem > rep else "REP"
             print(f" | {dem:,} vs {rep:,} → {winner} wins")
         else:
@@ -165,7 +298,196 @@ def create_districts_from_real_data(graph, num_districts=5, pop_col="TOTPOP"):
     return partition
 
 
-def run_real_data_simulation(initial_partition, num_steps=1000, pop_col="TOTPOP"):
+def graph_to_csr(graph):
+    """
+    Adjacency of the graph in int32 CSR form (indptr, indices), with nodes
+    numbered by their position in graph.nodes
+    """
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=list(graph.nodes), format="csr")
+    return adjacency.indptr.astype(np.int32), adjacency.indices.astype(np.int32)
+
+
+@njit(cache=True)
+def connected_after_removal(indptr, indices, assign, removed, district, visited, queue):
+    """
+    Whether the neighbors of `removed` in `district` can still reach each
+    other within the district. `visited` must be all zeros on entry and is
+    zeroed again before returning; `queue` needs room for every node.
+    """
+    # Mark the neighbors that have to be found
+    remaining = 0
+    start = -1
+    for e in range(indptr[removed], indptr[removed + 1]):
+        v = indices[e]
+        if assign[v] == district and visited[v] == 0:
+            visited[v] = 2
+            remaining += 1
+            start = v
+
+    # With no neighbors left in it, the old district has vanished
+    if remaining == 0:
+        return False
+
+    visited[start] = 1
+    remaining -= 1
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail and remaining > 0:
+        u = queue[head]
+        head += 1
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            if v != removed and assign[v] == district and visited[v] != 1:
+                if visited[v] == 2:
+                    remaining -= 1
+                visited[v] = 1
+                queue[tail] = v
+                tail += 1
+
+    # Roll back only the entries this search touched
+    for i in range(tail):
+        visited[queue[i]] = 0
+    for e in range(indptr[removed], indptr[removed + 1]):
+        visited[indices[e]] = 0
+
+    return remaining == 0
+
+
+@njit(cache=True)
+def run_chain(indptr, indices, assignment, dem, rep, district_dem, district_rep,
+              num_steps, seed, out_results):
+    """
+    Advance a single-flip chain `num_steps` accepted moves on flat arrays,
+    writing the number of Democratic district wins after each move into
+    `out_results`. Mirrors propose_random_flip under single_flip_contiguous
+    with an always-accept rule: pick a cut edge uniformly, flip one of its ends
+    into the other's district, and retry until the old district stays
+    connected. `assignment` and the district totals are updated in place, so
+    consecutive calls continue the same chain.
+    """
+    np.random.seed(seed)
+    n = assignment.shape[0]
+
+    # Number each undirected edge once, shared by both of its CSR entries
+    edge_of = np.full(indices.shape[0], -1, dtype=np.int64)
+    m = 0
+    for u in range(n):
+        for e in range(indptr[u], indptr[u + 1]):
+            if u < indices[e]:
+                edge_of[e] = m
+                m += 1
+    edge_u = np.empty(m, dtype=np.int32)
+    edge_v = np.empty(m, dtype=np.int32)
+    for u in range(n):
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            if u < v:
+                edge_u[edge_of[e]] = u
+                edge_v[edge_of[e]] = v
+            elif v < u:
+                for f in range(indptr[v], indptr[v + 1]):
+                    if indices[f] == u:
+                        edge_of[e] = edge_of[f]
+                        break
+
+    # Cut edges as a swap-remove list, with each edge's slot in it (-1 if uncut)
+    cut = np.empty(m, dtype=np.int64)
+    slot = np.full(m, -1, dtype=np.int64)
+    num_cut = 0
+    for i in range(m):
+        if assignment[edge_u[i]] != assignment[edge_v[i]]:
+            slot[i] = num_cut
+            cut[num_cut] = i
+            num_cut += 1
+
+    visited = np.zeros(n, dtype=np.uint8)
+    queue = np.empty(n, dtype=np.int32)
+
+    # Contiguity decision last computed for each node, which stays valid until
+    # the district it was computed for gains or loses a node
+    district_version = np.zeros(district_dem.shape[0], dtype=np.int64)
+    memo_district = np.full(n, -1, dtype=np.int32)
+    memo_version = np.zeros(n, dtype=np.int64)
+    memo_connected = np.zeros(n, dtype=np.bool_)
+
+    for step in range(num_steps):
+        moved = False
+        while num_cut > 0 and not moved:
+            choice = np.random.randint(0, 2 * num_cut)
+            i = cut[choice // 2]
+            if choice % 2 == 0:
+                node, other = edge_u[i], edge_v[i]
+            else:
+                node, other = edge_v[i], edge_u[i]
+
+            old = assignment[node]
+            new = assignment[other]
+            if memo_district[node] == old and memo_version[node] == district_version[old]:
+                connected = memo_connected[node]
+            else:
+                assignment[node] = new
+                connected = connected_after_removal(indptr, indices, assignment, node, old,
+                                                    visited, queue)
+                assignment[node] = old
+                memo_district[node] = old
+                memo_version[node] = district_version[old]
+                memo_connected[node] = connected
+
+            if connected:
+                assignment[node] = new
+                moved = True
+
+        if moved:
+            district_version[old] += 1
+            district_version[new] += 1
+            district_dem[old] -= dem[node]
+            district_dem[new] += dem[node]
+            district_rep[old] -= rep[node]
+            district_rep[new] += rep[node]
+
+            # Only the flipped node's edges can change whether they are cut
+            for e in range(indptr[node], indptr[node + 1]):
+                i = edge_of[e]
+                if i < 0:
+                    continue
+                is_cut = assignment[edge_u[i]] != assignment[edge_v[i]]
+                if is_cut and slot[i] < 0:
+                    slot[i] = num_cut
+                    cut[num_cut] = i
+                    num_cut += 1
+                elif not is_cut and slot[i] >= 0:
+                    last = cut[num_cut - 1]
+                    cut[slot[i]] = last
+                    slot[last] = slot[i]
+                    slot[i] = -1
+                    num_cut -= 1
+
+        wins = 0
+        for d in range(district_dem.shape[0]):
+            if district_dem[d] > district_rep[d]:
+                wins += 1
+        out_results[step] = wins
+
+
+# Starting partition for chains run in worker processes, set once per worker
+_worker_partition = None
+
+
+def _init_worker(partition):
+    """Stash the starting partition so each chain task only carries a seed"""
+    global _worker_partition
+    _worker_partition = partition
+
+
+def _run_worker_chain(seed, num_steps):
+    """Run one seeded chain from the worker's starting partition"""
+    random.seed(seed)
+    np.random.seed(seed)
+    return _run_chain(_worker_partition, num_steps, seed, verbose=False)
+
+
+def run_real_data_simulation(initial_partition, num_steps=1000, pop_col="TOTPOP", num_chains=1):
     """
     Run MCMC simulation on real data
 
@@ -173,80 +495,110 @@ def run_real_data_simulation(initial_partition, num_steps=1000, pop_col="TOTPOP"
         initial_partition: Starting partition
         num_steps (int): Number of simulation steps
         pop_col (str): Population column name
+        num_chains (int): Independent chains to split the steps across, run
+            in parallel worker processes when greater than 1
 
     Returns:
-        tuple: (partitions list, results data)
+        tuple: (results, initial_dem_wins) - Democratic wins for each step
+            (empty without election data) and for the initial map (None
+            without election data)
     """
     print(f"\n🎲 Running MCMC simulation with {num_steps} steps...")
     print("   Generating alternative fair district maps...")
 
-    # Check if we have election data
-    has_election_data = "dem_votes" in initial_partition.updaters
+    if num_chains <= 1:
+        results = _run_chain(initial_partition, num_steps, random.randrange(2**31))
+    else:
+        print(f"   Running {num_chains} independent chains in parallel...")
+        steps = [num_steps // num_chains + (c < num_steps % num_chains) for c in range(num_chains)]
+        seeds = [random.randrange(2**31) for _ in range(num_chains)]
+        with mp.Pool(num_chains, initializer=_init_worker, initargs=(initial_partition,)) as pool:
+            chunks = pool.starmap(_run_worker_chain, zip(seeds, steps))
+        results = np.concatenate(chunks)
 
-    # Set up the Markov chain with simple random flip proposal
-    chain = MarkovChain(
-        proposal=propose_random_flip,
-        constraints=[single_flip_contiguous],
-        accept=lambda x: True,
-        initial_state=initial_partition,
-        total_steps=num_steps
-    )
+    # Every chain's first state is the initial map
+    initial_dem_wins = int(results[0]) if len(results) else None
 
-    # Track results
-    results = []
+    print(f"✅ Simulation complete!")
 
-    for i, partition in enumerate(chain):
-        if has_election_data:
-            # Count Democratic wins
-            dem_wins = sum(
-                1 for district in partition.parts.keys()
-                if partition["dem_votes"][district] > partition["rep_votes"][district]
-            )
-            results.append(dem_wins)
+    return results, initial_dem_wins
 
-        # Progress update
-        if (i + 1) % 200 == 0:
-            print(f"   Step {i + 1}/{num_steps} complete")
 
-    print(f"✅ Simulation complete!")
+def _run_chain(initial_partition, num_steps, seed, verbose=True):
+    """Run a single chain and return the Democratic wins for each step"""
+    # Without election data there is nothing to score
+    if "dem_votes" not in initial_partition.updaters:
+        return np.empty(0, dtype=np.int16)
+
+    # Track results
+    district_ids = sorted(initial_partition.parts.keys())
+    k = len(district_ids)
+    results = np.empty(num_steps, dtype=np.int16)
+
+    # The whole chain runs in the compiled kernel on flat arrays: CSR
+    # adjacency, per-node votes, and a dense district index per node
+    graph = initial_partition.graph
+    indptr, indices = graph_to_csr(graph)
+    dem_arr = node_column(graph, initial_partition.updaters["dem_votes"].fields[0])
+    rep_arr = node_column(graph, initial_partition.updaters["rep_votes"].fields[0])
+
+    index_of = {d: i for i, d in enumerate(district_ids)}
+    mapping = initial_partition.assignment.mapping
+    assignment_arr = np.fromiter((index_of[mapping[i]] for i in range(len(mapping))),
+                                 dtype=np.int32, count=len(mapping))
+    dem_by_district = np.bincount(assignment_arr, weights=dem_arr, minlength=k).astype(np.int64)
+    rep_by_district = np.bincount(assignment_arr, weights=rep_arr, minlength=k).astype(np.int64)
+
+    if num_steps == 0:
+        return results
+
+    # The first state is the initial map; the rest come in blocks ending at
+    # every 200th state so progress can still be reported
+    results[0] = np.count_nonzero(dem_by_district > rep_by_district)
+    rng = np.random.default_rng(seed)
+    start = 1
+    while start < num_steps:
+        stop = min((start // 200 + 1) * 200, num_steps)
+        run_chain(indptr, indices, assignment_arr, dem_arr, rep_arr,
+                  dem_by_district, rep_by_district, stop - start,
+                  int(rng.integers(2**31)), results[start:stop])
+        start = stop
+
+        # Progress update
+        if verbose and stop % 200 == 0:
+            print(f"   Step {stop}/{num_steps} complete")
 
     return results
 
 
-def analyze_real_results(results, initial_partition, num_districts):
+def analyze_real_results(results, initial_dem_wins, num_districts):
     """
     Analyze simulation results from real data
 
     Args:
-        results (list): Democratic wins for each partition
-        initial_partition: Original partition
+        results (np.ndarray): Democratic wins for each partition
+        initial_dem_wins (int): Democratic wins in the original map
         num_districts (int): Total number of districts
     """
     print(f"\n📊 Analyzing Real Data Results...")
     print("=" * 60)
 
-    if not results:
+    if len(results) == 0:
         print("⚠️  No election data available for analysis")
         return
 
-    # Calculate initial Democratic wins
-    initial_dem_wins = sum(
-        1 for district in initial_partition.parts.keys()
-        if initial_partition["dem_votes"][district] > initial_partition["rep_votes"][district]
-    )
-
-    df = pd.DataFrame({"dem_districts": results})
+    counts = np.bincount(results, minlength=num_districts + 1)
 
     print(f"\nOriginal map: Democrats win {initial_dem_wins}/{num_districts} districts")
     print(f"\nIn {len(results)} alternative fair maps:")
-    print(f"   Average DEM districts: {df['dem_districts'].mean():.2f}")
-    print(f"   Median DEM districts: {df['dem_districts'].median():.1f}")
-    print(f"   Range: {df['dem_districts'].min()}-{df['dem_districts'].max()} districts")
+    print(f"   Average DEM districts: {np.mean(results):.2f}")
+    print(f"   Median DEM districts: {np.median(results):.1f}")
+    print(f"   Range: {np.min(results)}-{np.max(results)} districts")
 
     # Show distribution
     print(f"\n📈 Distribution of outcomes:")
     for districts in range(num_districts + 1):
-        count = (df['dem_districts'] == districts).sum()
+        count = counts[districts]
         percentage = (count / len(results)) * 100
         if count > 0:
             bar = "█" * int(percentage / 2)
@@ -254,8 +606,9 @@ def analyze_real_results(results, initial_partition, num_districts):
 
     # Gerrymandering analysis
     print(f"\n🔍 Gerrymandering Analysis:")
-    original_count = (df['dem_districts'] == initial_dem_wins).sum()
-    percentile = (df['dem_districts'] < initial_dem_wins).sum() / len(results) * 100
+    original_count = counts[initial_dem_wins]
+    # Maps with fewer DEM wins are already counted in the distribution
+    percentile = counts[:initial_dem_wins].sum() / len(results) * 100
 
     if percentile < 5 or percentile > 95:
         print(f"⚠️  SUSPICIOUS: Original result at {percentile:.1f} percentile")
@@ -284,7 +637,8 @@ def main():
     graph = load_real_data(shapefile_path)
 
     # Step 2: Analyze the data
-    voting_columns = analyze_data(graph)
+    columns = classify_columns(graph.nodes[next(iter(graph.nodes))])
+    voting_columns = analyze_data(graph, columns)
 
     # Step 3: Create districts
     # Use 3 districts for easier contiguity with real-world geography
@@ -292,14 +646,17 @@ def main():
     initial_partition = create_districts_from_real_data(
         graph,
         num_districts=num_districts,
-        pop_col="TOTPOP"
+        pop_col="TOTPOP",
+        columns=columns
     )
 
-    # Step 4: Run simulation
-    results = run_real_data_simulation(initial_partition, num_steps=1000)
+    # Step 4: Run simulation, splitting the steps across independent chains
+    num_chains = min(4, os.cpu_count() or 1)
+    results, initial_dem_wins = run_real_data_simulation(initial_partition, num_steps=1000,
+                                                         num_chains=num_chains)
 
     # Step 5: Analyze results
-    analyze_real_results(results, initial_partition, num_districts)
+    analyze_real_results(results, initial_dem_wins, num_districts)
 
     print(f"\n🎉 Real data simulation complete!")
     print("\nThis demonstrates GerryChain working with actual election data")
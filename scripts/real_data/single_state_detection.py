@@ -24,18 +24,63 @@ Example:
 """
 
 import os
+import re
 import sys
 import json
+import glob
+import pickle
+import hashlib
+import functools
+import multiprocessing as mp
+import random
+import importlib.util
+import geopandas as gpd
+import networkx as nx
 import numpy as np
+import pandas as pd
+import pyogrio
 from datetime import datetime
 from gerrychain import Graph, Partition, MarkovChain
-from gerrychain.proposals import propose_random_flip
-from gerrychain.constraints import single_flip_contiguous
+from gerrychain.proposals import propose_random_flip, recom
+from gerrychain.accept import always_accept
+from gerrychain.constraints import single_flip_contiguous, contiguous
 from gerrychain.updaters import cut_edges, Tally
 from gerrychain.tree import recursive_tree_part
 import warnings
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Read shapefiles through pyogrio; with pyarrow installed it also hands the
+# attribute columns over as Arrow batches instead of row by row
+gpd.options.io_engine = "pyogrio"
+USE_ARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Built graphs are cached here, one file per shapefile
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gerrychain_fra")
+
+# Column-name patterns used by detect_columns_from_names, matched against
+# upper-cased names
+POP_RE = re.compile(r'POP|PERSONS|VAP')  # TOTPOP, POPULATION, TOT_POP, CVAP, ...
+BIDEN_RE = re.compile(r'BID')
+TRUMP_RE = re.compile(r'TRU')
+CLINTON_RE = re.compile(r'CLIN|HRC')
+OBAMA_RE = re.compile(r'OBA')
+ROMNEY_RE = re.compile(r'ROM')
+VOTE_COUNT_RE = re.compile(r'VOTE|TOTAL|COUNT')
+
+# Election types in order of preference. The lookahead reports overlapping
+# matches at different positions, but only the first alternative that matches
+# at each one, so PRES columns never yield PRE; detection adds it for them.
+ELECTION_TYPES = ['PRES', 'PRE', 'SEN', 'USS', 'GOV', 'ATG']
+ELECTION_TYPE_RE = re.compile(r'(?=(PRES|PRE|SEN|USS|GOV|ATG))')
+
 # ============================================================================
 # CONFIGURATION - CHANGE THESE PARAMETERS
 # ============================================================================
@@ -51,6 +96,12 @@ NUM_STEPS = 1000  # Default: 1000 (use 500 for faster, 5000 for more accurate)
 # Population deviation tolerance
 EPSILON = 0.50  # Allow 50% population deviation between districts (needed for small states)
 
+# Independent MCMC chains to split the steps across (run in parallel processes)
+NUM_CHAINS = os.cpu_count() or 1
+
+# Proposal: "flip" (single-node flips) or "recom" (ReCom, mixes much faster)
+PROPOSAL = "flip"
+
 # ============================================================================
 
 
@@ -149,48 +200,91 @@ def find_shapefile(state_dir):
         if os.path.exists(shapefile):
             return shapefile
 
-    # Auto-detect: find first .shp file (excluding __MACOSX)
-    for root, _, files in os.walk(state_dir):
-        if '__MACOSX' in root:
-            continue
-        for file in files:
-            if file.endswith('.shp') and not file.startswith('.'):
-                return os.path.join(root, file)
+    # Auto-detect: find first .shp file, checking the state directory itself
+    # before searching subdirectories (excluding __MACOSX)
+    with os.scandir(state_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.shp') and not entry.name.startswith('.') and entry.is_file():
+                return entry.path
 
-    return None
+    return next((
+        path
+        for path in glob.iglob(os.path.join(glob.escape(state_dir), '**', '*.shp'),
+                               recursive=True)
+        if '__MACOSX' not in path and not os.path.basename(path).startswith('.')
+    ), None)
 
 
-def load_state_data(shapefile_path, state_name=None):
+def load_state_data(shapefile_path, state_name=None, columns=None):
     """
     Load state shapefile data
 
     Args:
         shapefile_path (str): Path to shapefile
         state_name (str): Name of the state (optional)
+        columns (dict): Detected data columns; when given, only these
+            attribute columns are read, and they are converted to whole
+            numbers (anything unparseable or missing becomes 0) (optional)
+
+    Nodes are renumbered 0..n-1 in breadth-first order so that neighboring
+    precincts sit close together in node-aligned arrays.
+
+    The built graph is cached in CACHE_DIR and reused while the shapefile
+    and the requested columns are unchanged.
 
     Returns:
         Graph: GerryChain graph or None on error
     """
     try:
+        usecols = [col for col in columns.values() if col] if columns else None
+        stat = os.stat(shapefile_path)
+        cache_key = (stat.st_mtime, stat.st_size, usecols)
+        cache_name = hashlib.sha1(os.path.abspath(shapefile_path).encode()).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, cache_name + ".graph.pkl")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_key, graph = pickle.load(f)
+                if cached_key == cache_key:
+                    print(f"  Loaded {len(graph.nodes)} precincts from cache")
+                    return graph
+            except Exception:
+                pass  # Unreadable or stale cache, rebuild it
+
         print(f"  Loading {shapefile_path}...")
+        gdf = gpd.read_file(shapefile_path, engine="pyogrio", use_arrow=USE_ARROW, columns=usecols)
+        for col in usecols or []:
+            gdf[col] = pd.to_numeric(gdf[col], errors='coerce').fillna(0).round().astype(np.int32)
         try:
-            graph = Graph.from_file(shapefile_path)
+            graph = Graph.from_geodataframe(gdf)
         except Exception as e:
             if "Invalid geometries" in str(e):
                 print(f"  Repairing invalid geometries...")
-                import geopandas as gpd
-                gdf = gpd.read_file(shapefile_path)
                 gdf['geometry'] = gdf['geometry'].buffer(0)
                 graph = Graph.from_geodataframe(gdf)
             else:
                 raise e
 
+        # Adjacency is built, so drop the shapes: only the attribute columns
+        # are needed from here on, in memory and in the cache
+        for _, data in graph.nodes(data=True):
+            data.pop('geometry', None)
+
         # Remove isolated nodes
-        isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+        isolated_nodes = list(nx.isolates(graph))
         if isolated_nodes:
             print(f"  Removing {len(isolated_nodes)} isolated nodes...")
             graph.remove_nodes_from(isolated_nodes)
 
+        graph = reorder_nodes_bfs(graph)
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((cache_key, graph), f, protocol=5)
+        except OSError:
+            pass  # Unwritable cache directory, just skip caching
+
         print(f"  Loaded {len(graph.nodes)} precincts")
         return graph
 
@@ -199,6 +293,51 @@ def load_state_data(shapefile_path, state_name=None):
         return None
 
 
+def reorder_nodes_bfs(graph):
+    """
+    Renumber nodes 0..n-1 in breadth-first order, one connected component
+    after another, so neighbors get nearby ids and nearby positions
+
+    Args:
+        graph: GerryChain graph
+
+    Returns:
+        Graph: A new graph with the nodes inserted in breadth-first order
+            (node and edge data only; the source shapes are not carried over)
+    """
+    order = []
+    seen = set()
+    for root in graph.nodes:
+        if root not in seen:
+            component = [root] + [node for _, node in nx.bfs_edges(graph, root)]
+            seen.update(component)
+            order.extend(component)
+
+    new_id = {node: i for i, node in enumerate(order)}
+    reordered = Graph()
+    reordered.add_nodes_from((new_id[node], graph.nodes[node]) for node in order)
+    reordered.add_edges_from((new_id[u], new_id[v], data) for u, v, data in graph.edges(data=True))
+    reordered.graph.update(graph.graph)
+    return reordered
+
+
+def read_field_names(shapefile_path):
+    """
+    Read a shapefile's attribute column names without loading any records
+
+    Args:
+        shapefile_path (str): Path to shapefile
+
+    Returns:
+        list: Field names or None on error
+    """
+    try:
+        return pyogrio.read_info(shapefile_path)["fields"].tolist()
+    except Exception as e:
+        print(f"  ERROR reading {shapefile_path}: {str(e)}")
+        return None
+
+
 def detect_data_columns(graph):
     """
     Detect available population and election data columns
@@ -213,18 +352,59 @@ def detect_data_columns(graph):
         return None
 
     sample_node = list(graph.nodes())[0]
-    node_data = graph.nodes[sample_node]
-    columns = list(node_data.keys())
+    return detect_columns_from_names(list(graph.nodes[sample_node].keys()))
 
+
+def detect_columns_from_names(columns):
+    """
+    Detect population and election data columns from column names alone
+
+    Args:
+        columns (list): Column names
+
+    Returns:
+        dict: Dictionary with 'population', 'dem', 'rep' column names
+    """
     result = {'population': None, 'dem': None, 'rep': None}
 
-    # Find population column
-    pop_candidates = ['TOTPOP', 'POP', 'POPULATION', 'TOT_POP', 'PERSONS', 'VAP', 'CVAP']
-    for col in columns:
-        col_upper = col.upper()
-        if any(cand in col_upper for cand in pop_candidates):
+    # Sort every column into the candidate lists in a single pass
+    biden_cols, trump_cols = [], []
+    clinton_cols, obama_cols, romney_cols = [], [], []
+    dem_candidates = {election_type: [] for election_type in ELECTION_TYPES}
+    dem_generic, rep_generic = [], []
+
+    # Upper-case every name once; the dict also gives O(1) name lookups
+    upper = {col: col.upper() for col in columns}
+
+    for col, col_upper in upper.items():
+
+        # Find population column
+        if result['population'] is None and POP_RE.search(col_upper):
             result['population'] = col
-            break
+
+        if BIDEN_RE.search(col_upper):
+            biden_cols.append(col)
+        if TRUMP_RE.search(col_upper):
+            trump_cols.append(col)
+        if CLINTON_RE.search(col_upper):
+            clinton_cols.append(col)
+        if OBAMA_RE.search(col_upper):
+            obama_cols.append(col)
+        if ROMNEY_RE.search(col_upper):
+            romney_cols.append(col)
+
+        if 'D' in col_upper:
+            election_types = set(ELECTION_TYPE_RE.findall(col_upper))
+            if 'PRES' in election_types:
+                election_types.add('PRE')
+            for election_type in election_types:
+                dem_candidates[election_type].append(col)
+
+        if VOTE_COUNT_RE.search(col_upper):
+            if 'DEM' in col_upper:
+                dem_generic.append(col)
+            if 'REP' in col_upper:
+                rep_generic.append(col)
 
     # If no population column found, create synthetic population based on vote totals
     if not result['population']:
@@ -233,13 +413,10 @@ def detect_data_columns(graph):
     # Find election columns with multiple strategies
 
     # Strategy 1: Look for Biden/Trump (2020 data)
-    biden_cols = [c for c in columns if 'BID' in c.upper() or 'BIDEN' in c.upper()]
-    trump_cols = [c for c in columns if 'TRU' in c.upper() or 'TRUMP' in c.upper()]
-
     if biden_cols and trump_cols:
         # Prioritize presidential race
-        pres_biden = [c for c in biden_cols if 'PRE' in c.upper()]
-        pres_trump = [c for c in trump_cols if 'PRE' in c.upper()]
+        pres_biden = [c for c in biden_cols if 'PRE' in upper[c]]
+        pres_trump = [c for c in trump_cols if 'PRE' in upper[c]]
         if pres_biden and pres_trump:
             result['dem'] = pres_biden[0]
             result['rep'] = pres_trump[0]
@@ -250,10 +427,6 @@ def detect_data_columns(graph):
         return result if result['population'] or result['dem'] else None
 
     # Strategy 2: Look for Clinton/Trump or Obama/Romney
-    clinton_cols = [c for c in columns if 'CLIN' in c.upper() or 'HRC' in c.upper()]
-    obama_cols = [c for c in columns if 'OBA' in c.upper()]
-    romney_cols = [c for c in columns if 'ROM' in c.upper()]
-
     if clinton_cols and trump_cols:
         result['dem'] = clinton_cols[0]
         result['rep'] = trump_cols[0]
@@ -265,17 +438,14 @@ def detect_data_columns(graph):
         return result if result['population'] or result['dem'] else None
 
     # Strategy 3: Generic pattern matching (PRES16D, PRES12R, etc.)
-    election_types = ['PRES', 'PRE', 'SEN', 'USS', 'GOV', 'ATG']
-
-    for election_type in election_types:
-        dem_candidates = [c for c in columns if election_type in c.upper() and 'D' in c.upper()]
-        if dem_candidates:
-            dem_col = dem_candidates[0]
+    for election_type in ELECTION_TYPES:
+        if dem_candidates[election_type]:
+            dem_col = dem_candidates[election_type][0]
             # Try to find corresponding Republican column
             rep_col = None
             for variant in [dem_col.replace('D', 'R'), dem_col.replace('d', 'r'),
                            dem_col.replace('DEM', 'REP'), dem_col.replace('dem', 'rep')]:
-                if variant in columns:
+                if variant in upper:
                     rep_col = variant
                     break
 
@@ -285,9 +455,6 @@ def detect_data_columns(graph):
                 return result if result['population'] or result['dem'] else None
 
     # Strategy 4: Look for any columns with DEM/REP or D/R
-    dem_generic = [c for c in columns if 'DEM' in c.upper() and any(x in c.upper() for x in ['VOTE', 'TOTAL', 'COUNT'])]
-    rep_generic = [c for c in columns if 'REP' in c.upper() and any(x in c.upper() for x in ['VOTE', 'TOTAL', 'COUNT'])]
-
     if dem_generic and rep_generic:
         result['dem'] = dem_generic[0]
         result['rep'] = rep_generic[0]
@@ -296,6 +463,44 @@ def detect_data_columns(graph):
     return None
 
 
+class ArrayTally:
+    """
+    Per-district totals of a node column kept in NumPy arrays
+
+    The column is read once into an int32 array aligned with the graph's node
+    order, and each partition's int64 totals come from its parent's by moving
+    only the flipped nodes' values. Districts must be labelled 0..k-1.
+    """
+
+    __slots__ = ["values", "node_index", "alias"]
+
+    def __init__(self, graph, column, alias):
+        self.node_index = {node: i for i, node in enumerate(graph.nodes)}
+        self.values = np.fromiter(
+            (data[column] for _, data in graph.nodes(data=True)),
+            dtype=np.int32,
+            count=len(self.node_index)
+        )
+        self.alias = alias
+
+    def __call__(self, partition):
+        parent = partition.parent
+        if parent is None:
+            assignment = partition.assignment
+            parts = np.fromiter((assignment[node] for node in self.node_index), dtype=np.int64,
+                                count=len(self.node_index))
+            tally = np.zeros(len(partition.parts), dtype=np.int64)
+            np.add.at(tally, parts, self.values)
+            return tally
+
+        tally = parent[self.alias].copy()
+        for node, new_part in partition.flips.items():
+            value = self.values[self.node_index[node]]
+            tally[parent.assignment[node]] -= value
+            tally[new_part] += value
+        return tally
+
+
 def create_initial_partition(graph, columns, num_districts=5, epsilon=0.30):
     """
     Create initial district partition
@@ -314,38 +519,17 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.30):
         dem_col = columns['dem']
         rep_col = columns['rep']
 
-        # Ensure all data is numeric (convert strings to numbers)
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-
-            # Convert dem votes to numeric
-            if dem_col in node_data:
-                try:
-                    node_data[dem_col] = float(node_data[dem_col])
-                except (ValueError, TypeError):
-                    node_data[dem_col] = 0
-
-            # Convert rep votes to numeric
-            if rep_col in node_data:
-                try:
-                    node_data[rep_col] = float(node_data[rep_col])
-                except (ValueError, TypeError):
-                    node_data[rep_col] = 0
-
-            # Handle population column
-            if pop_col and pop_col in node_data:
-                try:
-                    node_data[pop_col] = float(node_data[pop_col])
-                except (ValueError, TypeError):
-                    node_data[pop_col] = 0
-            elif not pop_col:
-                # Use vote total as proxy for population
-                node_data['synthetic_pop'] = node_data.get(dem_col, 0) + node_data.get(rep_col, 0)
+        # Columns are already numeric: load_state_data converts them on read
 
         # Use synthetic population if no population column
         if not pop_col:
             pop_col = 'synthetic_pop'
             columns['population'] = pop_col
+            # Use vote total as proxy for population
+            nx.set_node_attributes(graph, {
+                node: data.get(dem_col, 0) + data.get(rep_col, 0)
+                for node, data in graph.nodes(data=True)
+            }, pop_col)
             print("  Using total votes as population proxy")
 
         total_pop = sum(graph.nodes[node].get(pop_col, 0) for node in graph.nodes())
@@ -358,22 +542,36 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.30):
         max_attempts = 10
         assignment = None
 
-        for attempt in range(max_attempts):
-            try:
-                assignment = recursive_tree_part(
-                    graph,
-                    range(num_districts),
-                    target_pop,
-                    pop_col,
-                    epsilon=epsilon
-                )
-                break
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    print(f"  Attempt {attempt + 1} failed, retrying...")
-                    continue
-                else:
-                    raise e
+        # recursive_tree_part draws from the global RNG, so keep its state to
+        # restore once the retries are done and later chain seeds stay random
+        saved_state = None
+
+        try:
+            for attempt in range(max_attempts):
+                # Give each retry its own reproducible seed so it draws different
+                # spanning trees from the attempt that just failed
+                if attempt > 0:
+                    if saved_state is None:
+                        saved_state = random.getstate()
+                    random.seed(attempt)
+                try:
+                    assignment = recursive_tree_part(
+                        graph,
+                        range(num_districts),
+                        target_pop,
+                        pop_col,
+                        epsilon=epsilon
+                    )
+                    break
+                except Exception as e:
+                    if attempt < max_attempts - 1:
+                        print(f"  Attempt {attempt + 1} failed, retrying...")
+                        continue
+                    else:
+                        raise e
+        finally:
+            if saved_state is not None:
+                random.setstate(saved_state)
 
         if assignment is None:
             raise Exception("Could not create valid partition after multiple attempts")
@@ -382,8 +580,8 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.30):
         updaters = {
             "cut_edges": cut_edges,
             "population": Tally(pop_col, alias="population"),
-            "dem_votes": Tally(dem_col, alias="dem_votes"),
-            "rep_votes": Tally(rep_col, alias="rep_votes"),
+            "dem_votes": ArrayTally(graph, dem_col, alias="dem_votes"),
+            "rep_votes": ArrayTally(graph, rep_col, alias="rep_votes"),
         }
 
         partition = Partition(graph, assignment, updaters)
@@ -394,7 +592,104 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.30):
         return None
 
 
-def run_ensemble(initial_partition, num_steps=1000, use_contiguity=True):
+# Starting partition for chains run in worker processes, rebuilt once per worker
+_worker_partition = None
+
+
+def _init_worker(graph, assignment, updaters):
+    """Rebuild the starting partition in a worker (Partitions do not pickle)"""
+    global _worker_partition
+    _worker_partition = Partition(graph, assignment, updaters)
+
+
+def _run_worker_chain(seed, num_steps, proposal, constraints):
+    """Run one seeded chain from the worker's starting partition"""
+    random.seed(seed)
+    return _run_single_chain(_worker_partition, num_steps, proposal, constraints,
+                             show_progress=False)
+
+
+@njit(cache=True)
+def update_lead(district, part_dem, part_rep, dem_leads, dem_wins):
+    """Re-check whether Democrats lead one district and adjust the win count"""
+    leads = part_dem[district] > part_rep[district]
+    dem_wins += int(leads) - int(dem_leads[district])
+    dem_leads[district] = leads
+    return dem_wins
+
+
+@njit(cache=True)
+def apply_flip(node_idx, new_district, assignment, dem_arr, rep_arr, part_dem, part_rep,
+               dem_leads, dem_wins):
+    """
+    Move one node (and its votes) to a new district and return the updated
+    number of districts Democrats lead (assignment, part_dem, part_rep and
+    dem_leads change in place)
+    """
+    old_district = assignment[node_idx]
+    assignment[node_idx] = new_district
+    dem = dem_arr[node_idx]
+    rep = rep_arr[node_idx]
+    part_dem[old_district] -= dem
+    part_rep[old_district] -= rep
+    part_dem[new_district] += dem
+    part_rep[new_district] += rep
+    dem_wins = update_lead(old_district, part_dem, part_rep, dem_leads, dem_wins)
+    return update_lead(new_district, part_dem, part_rep, dem_leads, dem_wins)
+
+
+def _run_single_chain(initial_partition, num_steps, proposal, constraints, show_progress=True):
+    """Run one chain and return an array of the Democratic district wins for each step"""
+    chain = MarkovChain(
+        proposal=proposal,
+        constraints=constraints,
+        accept=always_accept,
+        initial_state=initial_partition,
+        total_steps=num_steps
+    )
+
+    # District of each node, per-district vote totals, which districts
+    # Democrats lead, and how many, kept up to date by moving each flipped node
+    dem_tally = initial_partition.updaters["dem_votes"]
+    rep_tally = initial_partition.updaters["rep_votes"]
+    node_index = dem_tally.node_index
+    assignment = np.empty(len(node_index), dtype=np.int32)
+    for node, district in initial_partition.assignment.items():
+        assignment[node_index[node]] = district
+    part_dem = initial_partition["dem_votes"].copy()
+    part_rep = initial_partition["rep_votes"].copy()
+    dem_leads = part_dem > part_rep
+    current_dem_wins = int(np.count_nonzero(dem_leads))
+    previous = initial_partition
+
+    # Progress messages every 10%, keyed by the step they are printed after
+    milestones = {}
+    if show_progress:
+        print(f"  Progress: ", end='', flush=True)
+        step = max(num_steps // 10, 1)
+        milestones = {i: f"{i*100//num_steps}%..." for i in range(step, num_steps + 1, step)}
+
+    dem_wins = np.empty(num_steps, dtype=np.int16)
+    for i, partition in enumerate(chain, 1):
+        if i in milestones:
+            print(milestones[i], end='', flush=True)
+
+        if partition is not previous:
+            for node, new_district in partition.flips.items():
+                current_dem_wins = apply_flip(
+                    node_index[node], new_district, assignment,
+                    dem_tally.values, rep_tally.values, part_dem, part_rep, dem_leads,
+                    current_dem_wins
+                )
+        previous = partition
+
+        dem_wins[i - 1] = current_dem_wins
+
+    return dem_wins
+
+
+def run_ensemble(initial_partition, num_steps=1000, use_contiguity=True, num_chains=1,
+                 proposal="flip", epsilon=0.30):
     """
     Run MCMC ensemble
 
@@ -402,14 +697,19 @@ def run_ensemble(initial_partition, num_steps=1000, use_contiguity=True):
         initial_partition: Starting partition
         num_steps (int): Number of steps
         use_contiguity (bool): Whether to enforce contiguity constraint
+        num_chains (int): Independent chains to split the steps across, run
+            in parallel worker processes when greater than 1
+        proposal (str): "flip" for single-node flips or "recom" for ReCom
+            (ReCom needs a contiguous starting map and falls back to flips
+            otherwise)
+        epsilon (float): Population deviation tolerance for ReCom
 
     Returns:
-        list: Democratic district wins for each step
+        tuple: (Democratic district wins for each step as an int16 array,
+            whether the initial partition was contiguous) or None on error
     """
     try:
         # First verify the initial partition is contiguous if we're enforcing it
-        from gerrychain.constraints import contiguous
-
         is_contiguous = contiguous(initial_partition)
 
         if use_contiguity and not is_contiguous:
@@ -429,36 +729,53 @@ def run_ensemble(initial_partition, num_steps=1000, use_contiguity=True):
             constraints = []  # No constraints for disconnected geographies
             print(f"  Running ensemble without contiguity constraint")
 
-        chain = MarkovChain(
-            proposal=propose_random_flip,
-            constraints=constraints,
-            accept=lambda _: True,
-            initial_state=initial_partition,
-            total_steps=num_steps
-        )
+        # ReCom keeps districts contiguous by construction, but only when the
+        # starting districts already are
+        if proposal == "recom" and use_contiguity:
+            population = initial_partition["population"]
+            proposal_fn = functools.partial(
+                recom,
+                pop_col=initial_partition.updaters["population"].fields[0],
+                pop_target=sum(population.values()) / len(population),
+                epsilon=epsilon,
+                node_repeats=2
+            )
+            constraints = []
+            print(f"  Using ReCom proposals")
+        else:
+            if proposal == "recom":
+                print(f"  ReCom needs contiguous districts, using single flips instead")
+            proposal_fn = propose_random_flip
 
-        dem_wins_list = []
-        print(f"  Progress: ", end='', flush=True)
-        for i, partition in enumerate(chain):
-            # Print progress every 10%
-            if (i + 1) % (num_steps // 10) == 0:
-                print(f"{(i+1)*100//num_steps}%...", end='', flush=True)
-
-            dem_wins = sum(
-                1 for district in partition.parts.keys()
-                if partition["dem_votes"][district] > partition["rep_votes"][district]
+        if num_chains <= 1:
+            dem_wins = _run_single_chain(initial_partition, num_steps, proposal_fn, constraints)
+        else:
+            print(f"  Running {num_chains} independent chains in parallel...", end='', flush=True)
+            steps = [num_steps // num_chains + (c < num_steps % num_chains)
+                     for c in range(num_chains)]
+            seeds = [random.randrange(2**31) for _ in range(num_chains)]
+            initargs = (
+                initial_partition.graph.graph,
+                dict(initial_partition.assignment.mapping),
+                initial_partition.updaters
             )
-            dem_wins_list.append(dem_wins)
+            with mp.Pool(num_chains, initializer=_init_worker, initargs=initargs) as pool:
+                chunks = pool.starmap(
+                    _run_worker_chain,
+                    [(seed, n, proposal_fn, constraints) for seed, n in zip(seeds, steps)]
+                )
+            dem_wins = np.concatenate(chunks)
 
         print(" Done!")
-        return dem_wins_list
+        return dem_wins, is_contiguous
 
     except Exception as e:
         print(f"\n  ERROR running ensemble: {str(e)}")
         return None
 
 
-def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000, epsilon=0.30):
+def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000, epsilon=0.30,
+                  num_chains=1, proposal="flip"):
     """
     Run full gerrymandering detection for a state
 
@@ -468,6 +785,8 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000
         num_districts (int): Number of districts to create (None to auto-detect)
         num_steps (int): MCMC steps
         epsilon (float): Population deviation tolerance
+        num_chains (int): Independent MCMC chains to run in parallel
+        proposal (str): "flip" or "recom"
 
     Returns:
         dict: Analysis results or None on error
@@ -476,16 +795,20 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000
     print(f"GERRYMANDERING DETECTION ANALYSIS: {state_name.upper()}")
     print(f"{'='*70}")
 
-    # Load data
-    graph = load_state_data(shapefile_path, state_name)
-    if not graph:
+    # Detect columns from the field names, so only those columns get loaded
+    fields = read_field_names(shapefile_path)
+    if fields is None:
         return None
 
-    # Detect columns
-    columns = detect_data_columns(graph)
+    columns = detect_columns_from_names(fields)
     if not columns:
         print(f"  ERROR: Could not find required data columns")
-        print(f"  Available columns: {list(graph.nodes[list(graph.nodes())[0]].keys())}")
+        print(f"  Available columns: {fields}")
+        return None
+
+    # Load data
+    graph = load_state_data(shapefile_path, state_name, columns)
+    if not graph:
         return None
 
     print(f"  Using columns:")
@@ -520,13 +843,10 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000
         return None
 
     # Calculate initial statistics
-    initial_dem_wins = sum(
-        1 for district in partition.parts.keys()
-        if partition["dem_votes"][district] > partition["rep_votes"][district]
-    )
+    initial_dem_wins = int(np.count_nonzero(partition["dem_votes"] > partition["rep_votes"]))
 
-    total_dem = sum(partition["dem_votes"].values())
-    total_rep = sum(partition["rep_votes"].values())
+    total_dem = partition["dem_votes"].sum()
+    total_rep = partition["rep_votes"].sum()
     dem_vote_share = total_dem / (total_dem + total_rep) * 100
 
     print(f"\n  INITIAL MAP STATISTICS:")
@@ -537,20 +857,23 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000
 
     # Run ensemble
     print(f"\n  Running {num_steps}-step MCMC ensemble...")
-    dem_wins_list = run_ensemble(partition, num_steps)
-    if not dem_wins_list:
+    ensemble = run_ensemble(partition, num_steps, num_chains=num_chains,
+                            proposal=proposal, epsilon=epsilon)
+    if ensemble is None or not len(ensemble[0]):
         return None
+    dem_wins_arr, initial_was_contiguous = ensemble
 
     # Analyze results
-    mean_dem = np.mean(dem_wins_list)
-    std_dem = np.std(dem_wins_list)
-    min_dem = min(dem_wins_list)
-    max_dem = max(dem_wins_list)
+    counts = np.bincount(dem_wins_arr, minlength=num_districts + 1)
+    mean_dem = dem_wins_arr.mean()
+    std_dem = dem_wins_arr.std()
+    min_dem = int(dem_wins_arr.min())
+    max_dem = int(dem_wins_arr.max())
 
     # Calculate percentile (using midpoint method for ties)
-    below_initial = sum(1 for x in dem_wins_list if x < initial_dem_wins)
-    equal_initial = sum(1 for x in dem_wins_list if x == initial_dem_wins)
-    percentile = ((below_initial + 0.5 * equal_initial) / len(dem_wins_list)) * 100
+    below_initial = int(counts[:initial_dem_wins].sum())
+    equal_initial = int(counts[initial_dem_wins])
+    percentile = ((below_initial + 0.5 * equal_initial) / len(dem_wins_arr)) * 100
 
     # Calculate z-score
     z_score = (initial_dem_wins - mean_dem) / std_dem if std_dem > 0 else 0
@@ -576,16 +899,13 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=1000
         print(f"    The initial map is within expected range of neutral maps.")
 
     # Check if contiguity was used
-    from gerrychain.constraints import contiguous
-    if not contiguous(partition):
+    if not initial_was_contiguous:
         print(f"\n    ℹ️  Note: Analysis was performed without contiguity constraint")
         print(f"    This is typically due to islands or disconnected geography.")
         print(f"    Results should be interpreted with caution.")
 
     # Create histogram data
-    histogram = {}
-    for wins in dem_wins_list:
-        histogram[wins] = histogram.get(wins, 0) + 1
+    histogram = {int(wins): int(count) for wins, count in enumerate(counts) if count}
 
     # Print distribution
     print(f"\n  DISTRIBUTION OF DEMOCRATIC DISTRICTS:")
@@ -658,7 +978,9 @@ def main():
         shapefile,
         num_districts=num_districts,
         num_steps=NUM_STEPS,
-        epsilon=EPSILON
+        epsilon=EPSILON,
+        num_chains=NUM_CHAINS,
+        proposal=PROPOSAL
     )
 
     if result:
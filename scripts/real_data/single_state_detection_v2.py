@@ -20,13 +20,27 @@ Example:
     STATE_NAME = "pennsylvania"
     STATE_NAME = "north-carolina"
     STATE_NAME = "wisconsin"
+
+A list of states is analyzed in parallel, one state per worker process:
+    STATE_NAME = ["pennsylvania", "north-carolina", "wisconsin"]
 """
 
 import os
+import re
 import sys
 import json
+import random
+import pickle
+import hashlib
+import importlib.util
+import networkx as nx
 import numpy as np
+import pandas as pd
+import pyogrio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from functools import partial
 from gerrychain import Graph, Partition, MarkovChain
 from gerrychain.proposals import recom
@@ -37,11 +51,34 @@ from gerrychain.accept import always_accept
 import warnings
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Read shapefiles through Arrow when pyarrow is installed (much faster for wide
+# attribute tables); pyogrio falls back to its own reader otherwise
+USE_ARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Parsed graphs (and their detected data columns) are cached here, keyed by
+# shapefile path, modification time and size
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gerrychain_fra")
+
+# Column-name patterns used by detect_data_columns, matched against
+# upper-cased names
+POP_RE = re.compile(r'POP|PERSONS|VAP')  # TOTPOP, POPULATION, TOT_POP, CVAP, ...
+BIDEN_RE = re.compile(r'BID')
+TRUMP_RE = re.compile(r'TRU')
+CLINTON_RE = re.compile(r'CLIN|HRC')
+OBAMA_RE = re.compile(r'OBA')
+ROMNEY_RE = re.compile(r'ROM')
+
+# Election types in order of preference. The lookahead reports overlapping
+# matches at different positions, but only the first alternative that matches
+# at each one, so PRES columns never yield PRE; detection adds it for them.
+ELECTION_TYPES = ['PRES', 'PRE', 'SEN', 'USS', 'GOV', 'ATG']
+ELECTION_TYPE_RE = re.compile(r'(?=(PRES|PRE|SEN|USS|GOV|ATG))')
+
 # ============================================================================
 # CONFIGURATION - CHANGE THESE PARAMETERS
 # ============================================================================
 
-STATE_NAME = "wisconsin"  # ← CHANGE THIS to analyze different states
+STATE_NAME = "wisconsin"  # ← CHANGE THIS to analyze different states (or a list of states)
 
 # Optional: Override number of districts (if None, will auto-detect)
 NUM_DISTRICTS = 8  # Set to an integer like 5, 10, etc. or leave as None
@@ -56,6 +93,9 @@ NUM_STEPS = 2000  # Increased from 1000 for better exploration
 # Population deviation tolerance (lower = stricter district equality)
 EPSILON = 0.05  # 5% deviation
 
+# Independent MCMC chains to split the steps across (run in parallel processes)
+NUM_CHAINS = os.cpu_count() or 1
+
 # Gerrymandering detection threshold (percentile cutoffs)
 OUTLIER_THRESHOLD = 10  # Flag if < 10th or > 90th percentile (was 5%)
 
@@ -143,6 +183,22 @@ REAL_DISTRICTS = {
 }
 
 
+# No slots=True: dataclass slots need Python 3.10, and these scripts still
+# support 3.9 (see requirements.txt)
+@dataclass(frozen=True)
+class StateInfo:
+    """Per-state metadata: primary shapefile (None to auto-detect) and real district count"""
+    shapefile: Optional[str]
+    districts: Optional[int]
+
+
+# Both tables above merged into one lookup per state
+STATE_INFO = {
+    state: StateInfo(STATE_CONFIGS.get(state), REAL_DISTRICTS.get(state))
+    for state in STATE_CONFIGS.keys() | REAL_DISTRICTS.keys()
+}
+
+
 def find_shapefile(state_dir):
     """
     Find the primary shapefile for a state
@@ -156,8 +212,9 @@ def find_shapefile(state_dir):
     state_name = os.path.basename(state_dir.rstrip('/'))
 
     # Try configured shapefile first
-    if state_name in STATE_CONFIGS and STATE_CONFIGS[state_name]:
-        shapefile = os.path.join(state_dir, STATE_CONFIGS[state_name])
+    info = STATE_INFO.get(state_name)
+    if info and info.shapefile:
+        shapefile = os.path.join(state_dir, info.shapefile)
         if os.path.exists(shapefile):
             return shapefile
 
@@ -185,20 +242,19 @@ def load_state_data(shapefile_path, state_name=None):
     """
     try:
         print(f"  Loading {shapefile_path}...")
+        gdf = pyogrio.read_dataframe(shapefile_path, use_arrow=USE_ARROW)
         try:
-            graph = Graph.from_file(shapefile_path)
+            graph = Graph.from_geodataframe(gdf)
         except Exception as e:
             if "Invalid geometries" in str(e):
                 print(f"  Repairing invalid geometries...")
-                import geopandas as gpd
-                gdf = gpd.read_file(shapefile_path)
                 gdf['geometry'] = gdf['geometry'].buffer(0)
                 graph = Graph.from_geodataframe(gdf)
             else:
                 raise e
 
         # Remove isolated nodes
-        isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+        isolated_nodes = list(nx.isolates(graph))
         if isolated_nodes:
             print(f"  Removing {len(isolated_nodes)} isolated nodes...")
             graph.remove_nodes_from(isolated_nodes)
@@ -211,6 +267,51 @@ def load_state_data(shapefile_path, state_name=None):
         return None
 
 
+def _cached_graph(shapefile_path, state_name=None):
+    """
+    Load a state's graph and detect its data columns, reusing the pickled
+    result from CACHE_DIR while the shapefile is unchanged
+
+    Args:
+        shapefile_path (str): Path to shapefile
+        state_name (str): Name of the state (optional)
+
+    Returns:
+        tuple: (graph, columns); graph is None if the shapefile could not be
+            loaded, columns is None if no data columns were found
+    """
+    stat = os.stat(shapefile_path)
+    key = f"{os.path.abspath(shapefile_path)}:{stat.st_mtime}:{stat.st_size}"
+    cache_name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, cache_name + ".pkl")
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                graph, columns = pickle.load(f)
+            print(f"  Loaded {len(graph.nodes)} precincts from cache")
+            return graph, columns
+        except Exception:
+            pass  # Unreadable cache, rebuild it
+
+    graph = load_state_data(shapefile_path, state_name)
+    if not graph:
+        return None, None
+    columns = detect_data_columns(graph)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so parallel runs never read a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((graph, columns), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+    return graph, columns
+
+
 def detect_data_columns(graph):
     """
     Detect available population and election data columns with improved logic
@@ -224,19 +325,64 @@ def detect_data_columns(graph):
     if not graph.nodes:
         return None
 
-    sample_node = list(graph.nodes())[0]
-    node_data = graph.nodes[sample_node]
-    columns = list(node_data.keys())
+    sample_node = next(iter(graph.nodes))
+    columns = list(graph.nodes[sample_node].keys())
+    column_set = set(columns)
 
     result = {'population': None, 'dem': None, 'rep': None}
 
-    # Find population column
-    pop_candidates = ['TOTPOP', 'POP', 'POPULATION', 'TOT_POP', 'PERSONS', 'VAP', 'CVAP']
-    for col in columns:
+    # Sort every column into the candidate lists in a single pass,
+    # upper-casing each name once
+    biden_cols, trump_cols = [], []
+    clinton_cols, obama_cols, romney_cols = [], [], []
+    first_pair_by_type = {}  # election type -> first (dem, rep) column pair
+    dem_generic = []
+    rep_by_base = {}    # stripped base name -> first two (index, column)
+    rep_by_prefix = {}  # first 3 characters of the base -> first two (index, column)
+
+    for index, col in enumerate(columns):
         col_upper = col.upper()
-        if any(cand in col_upper for cand in pop_candidates):
+
+        # Find population column
+        if result['population'] is None and POP_RE.search(col_upper):
             result['population'] = col
-            break
+
+        if BIDEN_RE.search(col_upper):
+            biden_cols.append(col)
+        if TRUMP_RE.search(col_upper):
+            trump_cols.append(col)
+        if CLINTON_RE.search(col_upper):
+            clinton_cols.append(col)
+        if OBAMA_RE.search(col_upper):
+            obama_cols.append(col)
+        if ROMNEY_RE.search(col_upper):
+            romney_cols.append(col)
+
+        # Paired D/R columns with the same base name (PRES16D / PRES16R)
+        election_types = set(ELECTION_TYPE_RE.findall(col_upper))
+        if 'PRES' in election_types:
+            election_types.add('PRE')
+        if election_types:
+            if 'DEM' in col_upper:
+                variants = [col.replace('DEM', 'REP'), col.replace('Dem', 'Rep'),
+                            col.replace('dem', 'rep')]
+            elif 'D' in col_upper:
+                variants = [col.replace('D', 'R'), col.replace('d', 'r')]
+            else:
+                variants = []
+            rep_col = next((v for v in variants if v in column_set and v != col), None)
+            if rep_col:
+                for election_type in election_types:
+                    first_pair_by_type.setdefault(election_type, (col, rep_col))
+
+        if 'DEM' in col_upper:
+            dem_generic.append(col)
+        if 'REP' in col_upper and 'GREP' not in col_upper:
+            rep_base = col_upper.replace('REP', '').replace('R', '')
+            for table, key in ((rep_by_base, rep_base), (rep_by_prefix, rep_base[:3])):
+                entries = table.setdefault(key, [])
+                if len(entries) < 2:
+                    entries.append((index, col))
 
     # If no population column found, create synthetic population based on vote totals
     if not result['population']:
@@ -246,9 +392,6 @@ def detect_data_columns(graph):
     # IMPORTANT: Make sure we don't use the same column for both parties!
 
     # Strategy 1: Look for Biden/Trump (2020 data)
-    biden_cols = [c for c in columns if 'BID' in c.upper() or 'BIDEN' in c.upper()]
-    trump_cols = [c for c in columns if 'TRU' in c.upper() or 'TRUMP' in c.upper()]
-
     if biden_cols and trump_cols:
         # Make sure they're different columns!
         if biden_cols[0] != trump_cols[0]:
@@ -265,10 +408,6 @@ def detect_data_columns(graph):
             return result if result['population'] or result['dem'] else None
 
     # Strategy 2: Look for Clinton/Trump or Obama/Romney
-    clinton_cols = [c for c in columns if 'CLIN' in c.upper() or 'HRC' in c.upper()]
-    obama_cols = [c for c in columns if 'OBA' in c.upper()]
-    romney_cols = [c for c in columns if 'ROM' in c.upper()]
-
     if clinton_cols and trump_cols and clinton_cols[0] != trump_cols[0]:
         result['dem'] = clinton_cols[0]
         result['rep'] = trump_cols[0]
@@ -281,51 +420,104 @@ def detect_data_columns(graph):
 
     # Strategy 3: Generic pattern matching (PRES16D, PRES12R, etc.)
     # Look for paired D/R columns with the same base name
-    election_types = ['PRES', 'PRE', 'SEN', 'USS', 'GOV', 'ATG']
-
-    for election_type in election_types:
-        # Find all columns with this election type
-        type_cols = [c for c in columns if election_type in c.upper()]
-
-        # Look for D/R pairs
-        for col in type_cols:
-            col_upper = col.upper()
-            # Check if this is a Democratic column
-            if 'D' in col_upper and 'DEM' not in col_upper:
-                # Try to find matching Republican column
-                for rep_variant in [col.replace('D', 'R'), col.replace('d', 'r')]:
-                    if rep_variant in columns and rep_variant != col:
-                        result['dem'] = col
-                        result['rep'] = rep_variant
-                        return result if result['population'] or result['dem'] else None
-            elif 'DEM' in col_upper:
-                # Try to find matching Republican column
-                for rep_variant in [col.replace('DEM', 'REP'), col.replace('Dem', 'Rep'),
-                                   col.replace('dem', 'rep')]:
-                    if rep_variant in columns and rep_variant != col:
-                        result['dem'] = col
-                        result['rep'] = rep_variant
-                        return result if result['population'] or result['dem'] else None
-
-    # Strategy 4: Look for any columns with DEM/REP or D/R that are paired
-    dem_generic = [c for c in columns if 'DEM' in c.upper()]
-    rep_generic = [c for c in columns if 'REP' in c.upper() and 'GREP' not in c.upper()]
+    for election_type in ELECTION_TYPES:
+        if election_type in first_pair_by_type:
+            result['dem'], result['rep'] = first_pair_by_type[election_type]
+            return result if result['population'] or result['dem'] else None
 
+    # Strategy 4: Look for any columns with DEM/REP or D/R that are paired,
+    # i.e. with the same base name or (for longer names) the same first 3
+    # characters once the party marker is stripped
     for dem_col in dem_generic:
-        for rep_col in rep_generic:
-            # Make sure they're different and likely from same race
-            if dem_col != rep_col:
-                # Check if they have similar base names
-                dem_base = dem_col.upper().replace('DEM', '').replace('D', '')
-                rep_base = rep_col.upper().replace('REP', '').replace('R', '')
-                if dem_base == rep_base or len(dem_base) > 3 and dem_base[:3] == rep_base[:3]:
-                    result['dem'] = dem_col
-                    result['rep'] = rep_col
-                    return result if result['population'] or result['dem'] else None
+        dem_base = dem_col.upper().replace('DEM', '').replace('D', '')
+        candidates = rep_by_base.get(dem_base, [])
+        if len(dem_base) > 3:
+            candidates = candidates + rep_by_prefix.get(dem_base[:3], [])
+        matches = [(index, rep_col) for index, rep_col in candidates if rep_col != dem_col]
+        if matches:
+            result['dem'] = dem_col
+            result['rep'] = min(matches)[1]
+            return result if result['population'] or result['dem'] else None
 
     return None
 
 
+def numeric_node_values(graph, nodes, col):
+    """
+    Read a node attribute as numbers, in the order of `nodes`
+
+    Args:
+        graph: GerryChain graph
+        nodes (list): Nodes to read
+        col (str): Attribute name
+
+    Returns:
+        ndarray: Values as int32 when they are all whole numbers (vote and
+            population counts normally are), float64 otherwise, with anything
+            unparseable or missing as 0
+    """
+    values = pd.Series([graph.nodes[node].get(col) for node in nodes], dtype=object)
+    values = pd.to_numeric(values, errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+    if np.array_equal(values, np.round(values)) and np.abs(values).max(initial=0) < 2**31:
+        return values.astype(np.int32)
+    return values
+
+
+class VoteTally:
+    """
+    Democratic and Republican votes per district as a (districts, 2) array
+
+    Rows follow the order of `districts`. The per-node votes are held in one
+    (nodes, 2) array, and each partition's tallies come from its parent's by
+    moving only the flipped nodes' rows.
+    """
+
+    __slots__ = ["node_index", "district_index", "votes_by_node", "alias"]
+
+    def __init__(self, nodes, votes_by_node, districts, alias="votes"):
+        self.node_index = {node: i for i, node in enumerate(nodes)}
+        self.district_index = {district: i for i, district in enumerate(districts)}
+        self.votes_by_node = votes_by_node
+        self.alias = alias
+
+    def __call__(self, partition):
+        parent = partition.parent
+        if parent is None:
+            assignment = partition.assignment
+            rows = np.fromiter((self.district_index[assignment[node]] for node in self.node_index),
+                               dtype=np.int64, count=len(self.node_index))
+            # Accumulate in 64 bits whatever the per-node dtype
+            tally = np.zeros((len(self.district_index), 2),
+                             dtype=np.promote_types(self.votes_by_node.dtype, np.int64))
+            np.add.at(tally, rows, self.votes_by_node)
+            return tally
+
+        tally = parent[self.alias].copy()
+        flips = partition.flips
+        if flips:
+            count = len(flips)
+            nodes = np.fromiter((self.node_index[node] for node in flips),
+                                dtype=np.int64, count=count)
+            old_rows = np.fromiter((self.district_index[parent.assignment[node]] for node in flips),
+                                   dtype=np.int64, count=count)
+            new_rows = np.fromiter((self.district_index[district] for district in flips.values()),
+                                   dtype=np.int64, count=count)
+            moved = self.votes_by_node[nodes]
+            np.subtract.at(tally, old_rows, moved)
+            np.add.at(tally, new_rows, moved)
+        return tally
+
+
+def dem_votes_by_district(partition):
+    """Democratic votes keyed by district, read from the "votes" tally"""
+    return dict(zip(partition.updaters["votes"].district_index, partition["votes"][:, 0]))
+
+
+def rep_votes_by_district(partition):
+    """Republican votes keyed by district, read from the "votes" tally"""
+    return dict(zip(partition.updaters["votes"].district_index, partition["votes"][:, 1]))
+
+
 def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actual_districts_col=None):
     """
     Create initial district partition
@@ -345,33 +537,16 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actu
         dem_col = columns['dem']
         rep_col = columns['rep']
 
-        # Ensure all data is numeric (convert strings to numbers)
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-
-            # Convert dem votes to numeric
-            if dem_col in node_data:
-                try:
-                    node_data[dem_col] = float(node_data[dem_col])
-                except (ValueError, TypeError):
-                    node_data[dem_col] = 0
-
-            # Convert rep votes to numeric
-            if rep_col in node_data:
-                try:
-                    node_data[rep_col] = float(node_data[rep_col])
-                except (ValueError, TypeError):
-                    node_data[rep_col] = 0
-
-            # Handle population column
-            if pop_col and pop_col in node_data:
-                try:
-                    node_data[pop_col] = float(node_data[pop_col])
-                except (ValueError, TypeError):
-                    node_data[pop_col] = 0
-            elif not pop_col:
-                # Use vote total as proxy for population
-                node_data['synthetic_pop'] = node_data.get(dem_col, 0) + node_data.get(rep_col, 0)
+        # Ensure all data is numeric (convert strings to numbers, anything
+        # unparseable or missing becomes 0)
+        nodes = list(graph.nodes)
+        dem_arr = numeric_node_values(graph, nodes, dem_col)
+        rep_arr = numeric_node_values(graph, nodes, rep_col)
+        if pop_col:
+            pop_arr = numeric_node_values(graph, nodes, pop_col)
+        else:
+            # Use vote total as proxy for population
+            pop_arr = dem_arr + rep_arr
 
         # Use synthetic population if no population column
         if not pop_col:
@@ -379,7 +554,13 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actu
             columns['population'] = pop_col
             print("  Using total votes as population proxy")
 
-        total_pop = sum(graph.nodes[node].get(pop_col, 0) for node in graph.nodes())
+        for node, dem, rep, pop in zip(nodes, dem_arr, rep_arr, pop_arr):
+            node_data = graph.nodes[node]
+            node_data[dem_col] = dem
+            node_data[rep_col] = rep
+            node_data[pop_col] = pop
+
+        total_pop = float(pop_arr.sum())
         target_pop = total_pop / num_districts
 
         print(f"  Total population: {total_pop:,.0f}")
@@ -424,12 +605,13 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actu
         if assignment is None:
             print(f"  Generating RANDOM initial districts using recursive tree partitioning...")
             max_attempts = 20
+            parts = range(num_districts)
 
             for attempt in range(max_attempts):
                 try:
                     assignment = recursive_tree_part(
                         graph,
-                        range(num_districts),
+                        parts,
                         target_pop,
                         pop_col,
                         epsilon=epsilon
@@ -447,11 +629,14 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actu
                 raise Exception("Could not create valid partition after multiple attempts")
 
         # Set up updaters
+        votes_by_node = np.column_stack([dem_arr, rep_arr])
+        districts = list(dict.fromkeys(assignment.values()))
         updaters = {
             "cut_edges": cut_edges,
             "population": Tally(pop_col, alias="population"),
-            "dem_votes": Tally(dem_col, alias="dem_votes"),
-            "rep_votes": Tally(rep_col, alias="rep_votes"),
+            "votes": VoteTally(nodes, votes_by_node, districts),
+            "dem_votes": dem_votes_by_district,
+            "rep_votes": rep_votes_by_district,
         }
 
         partition = Partition(graph, assignment, updaters)
@@ -464,7 +649,102 @@ def create_initial_partition(graph, columns, num_districts=5, epsilon=0.05, actu
         return None
 
 
-def run_ensemble(initial_partition, pop_col_name, num_steps=5000, epsilon=0.05):
+def _chain_setup(initial_partition, pop_col_name, epsilon, use_contiguity):
+    """Build the ReCom proposal and constraints for chains from initial_partition"""
+    # Calculate ideal population
+    total_pop = sum(initial_partition["population"].values())
+    num_districts = len(initial_partition.parts)
+    ideal_pop = total_pop / num_districts
+
+    # Set up constraints for ReCom - only use contiguity if initial partition is contiguous
+    constraints = [
+        within_percent_of_ideal_population(initial_partition, epsilon)
+    ]
+    if use_contiguity:
+        constraints.append(contiguous)
+
+    # Create ReCom proposal using partial - use the actual column name from the graph
+    proposal = partial(
+        recom,
+        pop_col=pop_col_name,
+        pop_target=ideal_pop,
+        epsilon=epsilon,
+        node_repeats=2
+    )
+    return proposal, constraints
+
+
+def _run_chain(initial_partition, proposal, constraints, num_steps, sample_interval,
+               show_progress=True):
+    """
+    Run one chain
+
+    Returns:
+        tuple: (array of dem_wins per step, (samples, districts, 3) array of
+            dem votes, rep votes and population per district, sampled every
+            sample_interval steps, districts in VoteTally order)
+    """
+    # Create Markov chain
+    chain = MarkovChain(
+        proposal=proposal,
+        constraints=constraints,
+        accept=always_accept,
+        initial_state=initial_partition,
+        total_steps=num_steps
+    )
+
+    dem_wins_list = np.empty(num_steps, dtype=np.int32)
+
+    # Progress messages every 10%, keyed by the step they are printed after
+    milestones = {}
+    if show_progress:
+        step = max(num_steps // 10, 1)
+        milestones = {i: f"{i*100//num_steps}%..." for i in range(step, num_steps + 1, step)}
+    sample_steps = range(0, num_steps, sample_interval)
+    districts = list(initial_partition.updaters["votes"].district_index)
+    samples = np.empty((len(sample_steps), len(districts), 3))
+
+    for i, partition in enumerate(chain):
+        if i + 1 in milestones:
+            print(milestones[i + 1], end='', flush=True)
+
+        votes = partition["votes"]
+        dem_wins_list[i] = np.count_nonzero(votes[:, 0] > votes[:, 1])
+
+        # Store sample district totals for later analysis
+        if i in sample_steps:
+            sample = samples[i // sample_interval]
+            sample[:, :2] = votes
+            population = partition["population"]
+            sample[:, 2] = [population[district] for district in districts]
+
+    return dem_wins_list, samples
+
+
+# Starting partition for chains run in worker processes, rebuilt once per worker
+_worker_partition = None
+
+
+def _init_chain_worker(graph, assignment, updaters):
+    """Rebuild the starting partition in a worker (Partitions do not pickle)"""
+    global _worker_partition
+    _worker_partition = Partition(graph, assignment, updaters)
+
+
+def _run_worker_chain(seed, pop_col_name, num_steps, epsilon, use_contiguity, sample_interval):
+    """
+    Run one seeded chain from the worker's starting partition
+
+    Returns:
+        tuple: (array of dem_wins per step, array of sampled district totals)
+    """
+    random.seed(seed)
+    proposal, constraints = _chain_setup(_worker_partition, pop_col_name, epsilon, use_contiguity)
+    return _run_chain(_worker_partition, proposal, constraints, num_steps,
+                      sample_interval, show_progress=False)
+
+
+def run_ensemble(initial_partition, pop_col_name, num_steps=5000, epsilon=0.05, num_chains=1):
     """
     Run MCMC ensemble using ReCom for proper exploration
 
@@ -473,9 +753,12 @@ def run_ensemble(initial_partition, pop_col_name, num_steps=5000, epsilon=0.05):
         pop_col_name (str): Name of the population column in the graph
         num_steps (int): Number of steps
         epsilon (float): Population deviation tolerance
+        num_chains (int): Independent chains to split the steps across, run
+            in parallel worker processes when greater than 1
 
     Returns:
-        tuple: (list of dem_wins, list of partitions for analysis)
+        tuple: (array of dem_wins per step, array of sampled district totals
+            for calculate_ensemble_average_map)
     """
     try:
         # Check if initial partition is contiguous
@@ -489,65 +772,44 @@ def run_ensemble(initial_partition, pop_col_name, num_steps=5000, epsilon=0.05):
             print(f"  Skipping contiguity constraint for ensemble")
             print(f"  Results may be less reliable for detecting gerrymandering\n")
 
-        # Calculate ideal population
-        total_pop = sum(initial_partition["population"].values())
-        num_districts = len(initial_partition.parts)
-        ideal_pop = total_pop / num_districts
-
-        # Set up constraints for ReCom - only use contiguity if initial partition is contiguous
-        constraints = [
-            within_percent_of_ideal_population(initial_partition, epsilon)
-        ]
-        if use_contiguity:
-            constraints.append(contiguous)
-
-        # Create ReCom proposal using partial - use the actual column name from the graph
-        proposal = partial(
-            recom,
-            pop_col=pop_col_name,
-            pop_target=ideal_pop,
-            epsilon=epsilon,
-            node_repeats=2
-        )
-
-        # Create Markov chain
-        chain = MarkovChain(
-            proposal=proposal,
-            constraints=constraints,
-            accept=always_accept,
-            initial_state=initial_partition,
-            total_steps=num_steps
-        )
-
-        dem_wins_list = []
-        partitions_sample = []  # Store some partitions for comparison
         sample_interval = max(1, num_steps // 100)  # Store ~100 samples
 
         if use_contiguity:
             print(f"  ✓ Using ReCom proposal with contiguity and {epsilon*100:.1f}% population constraint")
         else:
             print(f"  ✓ Using ReCom proposal with {epsilon*100:.1f}% population constraint (no contiguity)")
-        print(f"  Progress: ", end='', flush=True)
 
-        for i, partition in enumerate(chain):
-            # Print progress every 10%
-            if (i + 1) % (num_steps // 10) == 0:
-                print(f"{(i+1)*100//num_steps}%...", end='', flush=True)
-
-            dem_wins = sum(
-                1 for district in partition.parts.keys()
-                if partition["dem_votes"][district] > partition["rep_votes"][district]
+        if num_chains <= 1:
+            proposal, constraints = _chain_setup(initial_partition, pop_col_name, epsilon,
+                                                 use_contiguity)
+            print(f"  Progress: ", end='', flush=True)
+            dem_wins_list, samples = _run_chain(
+                initial_partition, proposal, constraints, num_steps, sample_interval
             )
-            dem_wins_list.append(dem_wins)
-
-            # Store sample partitions for later analysis
-            if i % sample_interval == 0:
-                partitions_sample.append(partition)
+        else:
+            print(f"  Running {num_chains} independent chains in parallel...", end='', flush=True)
+            steps = [num_steps // num_chains + (c < num_steps % num_chains)
+                     for c in range(num_chains)]
+            seeds = [random.randrange(2**31) for _ in range(num_chains)]
+            initargs = (
+                initial_partition.graph.graph,
+                dict(initial_partition.assignment.mapping),
+                initial_partition.updaters
+            )
+            with ProcessPoolExecutor(max_workers=num_chains, initializer=_init_chain_worker,
+                                     initargs=initargs) as executor:
+                chunks = list(executor.map(
+                    _run_worker_chain, seeds, [pop_col_name] * num_chains, steps,
+                    [epsilon] * num_chains, [use_contiguity] * num_chains,
+                    [sample_interval] * num_chains
+                ))
+            dem_wins_list = np.concatenate([dem_wins for dem_wins, _ in chunks])
+            samples = np.concatenate([chunk_samples for _, chunk_samples in chunks])
 
         print(" Done!")
 
         # Check if chain is working properly
-        if len(set(dem_wins_list)) == 1:
+        if dem_wins_list.min() == dem_wins_list.max():
             print(f"\n  ⚠️  WARNING: Ensemble produced identical results every time!")
             print(f"  This suggests the MCMC chain is stuck and not exploring properly.")
             print(f"  Possible causes:")
@@ -556,7 +818,7 @@ def run_ensemble(initial_partition, pop_col_name, num_steps=5000, epsilon=0.05):
             print(f"    - Too many districts for the number of precincts")
             print(f"  Results should be interpreted with EXTREME caution.\n")
 
-        return dem_wins_list, partitions_sample
+        return dem_wins_list, samples
 
     except Exception as e:
         print(f"\n  ERROR running ensemble: {str(e)}")
@@ -608,44 +870,27 @@ def get_district_statistics(partition):
     return district_stats
 
 
-def calculate_ensemble_average_map(partitions_sample):
+def calculate_ensemble_average_map(samples, districts):
     """
     Calculate the average district composition from ensemble samples
 
     Args:
-        partitions_sample: List of partition samples from ensemble
+        samples: (samples, districts, 3) array of dem votes, rep votes and
+            population per district, as returned by run_ensemble
+        districts (list): District labels, in the order of the array rows
 
     Returns:
-        dict: Average statistics per district
+        list: Average statistics per district (sorted by district number)
     """
-    if not partitions_sample:
+    if samples is None or not len(samples):
         return None
 
-    # Get all unique districts from the first partition
-    all_districts = list(partitions_sample[0].parts.keys())
-
-    # Accumulate statistics
-    avg_stats = {}
-    for district in all_districts:
-        avg_stats[district] = {
-            'dem_votes': [],
-            'rep_votes': [],
-            'population': []
-        }
-
-    # Collect all samples
-    for partition in partitions_sample:
-        for district in partition.parts.keys():
-            if district in avg_stats:  # Safety check
-                avg_stats[district]['dem_votes'].append(partition["dem_votes"][district])
-                avg_stats[district]['rep_votes'].append(partition["rep_votes"][district])
-                avg_stats[district]['population'].append(partition["population"][district])
+    averages = samples.mean(axis=0)
 
     # Calculate averages
     result = []
-    for district in sorted(avg_stats.keys()):
-        dem_avg = np.mean(avg_stats[district]['dem_votes'])
-        rep_avg = np.mean(avg_stats[district]['rep_votes'])
+    ordered = sorted(zip(districts, averages), key=lambda item: item[0])
+    for district, (dem_avg, rep_avg, pop_avg) in ordered:
         total_avg = dem_avg + rep_avg
 
         dem_pct = (dem_avg / total_avg * 100) if total_avg > 0 else 0
@@ -665,7 +910,7 @@ def calculate_ensemble_average_map(partitions_sample):
             'winner': winner,
             'margin': margin,
             'margin_pct': margin_pct,
-            'population': np.mean(avg_stats[district]['population'])
+            'population': pop_avg
         })
 
     return result
@@ -745,7 +990,8 @@ def print_detailed_statistics(initial_stats, ensemble_avg_stats, state_name):
             print(f"  Actual map gives Republicans {abs(seat_diff_rep)} FEWER seat(s) than expected")
 
 
-def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000, epsilon=0.05, actual_districts_col=None):
+def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000, epsilon=0.05,
+                  actual_districts_col=None, num_chains=1):
     """
     Run full gerrymandering detection for a state
 
@@ -756,6 +1002,7 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
         num_steps (int): MCMC steps
         epsilon (float): Population deviation tolerance
         actual_districts_col (str): Column name for actual districts (None to generate random)
+        num_chains (int): Independent MCMC chains to run in parallel
 
     Returns:
         dict: Analysis results or None on error
@@ -764,13 +1011,11 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
     print(f"GERRYMANDERING DETECTION ANALYSIS: {state_name.upper()}")
     print(f"{'='*70}")
 
-    # Load data
-    graph = load_state_data(shapefile_path, state_name)
+    # Load data and detect columns
+    graph, columns = _cached_graph(shapefile_path, state_name)
     if not graph:
         return None
 
-    # Detect columns
-    columns = detect_data_columns(graph)
     if not columns:
         print(f"  ERROR: Could not find required data columns")
         print(f"  Available columns: {list(graph.nodes[list(graph.nodes())[0]].keys())}")
@@ -790,8 +1035,9 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
     # Auto-detect number of districts if not specified
     if num_districts is None:
         # Use real congressional district counts if available
-        if state_name in REAL_DISTRICTS:
-            num_districts = REAL_DISTRICTS[state_name]
+        info = STATE_INFO.get(state_name)
+        if info and info.districts:
+            num_districts = info.districts
             print(f"  Using real congressional districts: {num_districts}")
         else:
             # Fallback to size-based estimation
@@ -853,22 +1099,26 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
 
     # Run ensemble
     print(f"\n  Running {num_steps}-step MCMC ensemble...")
-    dem_wins_list, partitions_sample = run_ensemble(partition, columns['population'], num_steps, epsilon)
-    if not dem_wins_list:
+    dem_wins_list, samples = run_ensemble(partition, columns['population'], num_steps, epsilon,
+                                          num_chains)
+    if dem_wins_list is None or not len(dem_wins_list):
         return None
 
     # Calculate ensemble average map
-    ensemble_avg_stats = calculate_ensemble_average_map(partitions_sample)
+    ensemble_avg_stats = calculate_ensemble_average_map(
+        samples, list(partition.updaters["votes"].district_index)
+    )
 
     # Analyze results
-    mean_dem = np.mean(dem_wins_list)
-    std_dem = np.std(dem_wins_list)
-    min_dem = min(dem_wins_list)
-    max_dem = max(dem_wins_list)
+    counts = np.bincount(dem_wins_list)
+    mean_dem = dem_wins_list.mean()
+    std_dem = dem_wins_list.std()
+    min_dem = int(dem_wins_list.min())
+    max_dem = int(dem_wins_list.max())
 
     # Calculate percentile (using midpoint method for ties)
-    below_initial = sum(1 for x in dem_wins_list if x < initial_dem_wins)
-    equal_initial = sum(1 for x in dem_wins_list if x == initial_dem_wins)
+    below_initial = int(counts[:initial_dem_wins].sum())
+    equal_initial = int(counts[initial_dem_wins]) if initial_dem_wins < len(counts) else 0
     percentile = ((below_initial + 0.5 * equal_initial) / len(dem_wins_list)) * 100
 
     # Calculate z-score
@@ -971,9 +1221,7 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
     print_detailed_statistics(initial_district_stats, ensemble_avg_stats, state_name)
 
     # Create histogram data
-    histogram = {}
-    for wins in dem_wins_list:
-        histogram[wins] = histogram.get(wins, 0) + 1
+    histogram = {int(wins): int(count) for wins, count in enumerate(counts) if count}
 
     # Print distribution
     print(f"\n  DISTRIBUTION OF DEMOCRATIC SEATS IN ENSEMBLE:")
@@ -1013,13 +1261,67 @@ def analyze_state(state_name, shapefile_path, num_districts=None, num_steps=5000
     }
 
 
+def analyze_states_parallel(specs, workers=None):
+    """
+    Run analyze_state for several states at once, one state per worker process
+
+    Args:
+        specs (list): analyze_state keyword arguments for each state
+            (must include state_name and shapefile_path)
+        workers (int): Worker processes (None for one per CPU)
+
+    Yields:
+        tuple: (state_name, analysis results or None), in completion order
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(analyze_state, **spec): spec['state_name'] for spec in specs}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def print_final_summary(state_name, result):
+    """
+    Print the closing summary for one analyzed state
+
+    Args:
+        state_name (str): State name
+        result (dict): analyze_state results
+    """
+    print(f"\n{'='*70}")
+    print(f"FINAL SUMMARY")
+    print(f"{'='*70}")
+    print(f"State: {state_name.upper()}")
+    print(f"Precincts analyzed: {result['precincts']}")
+    print(f"Districts: {result['num_districts']}")
+    print(f"")
+    print(f"Vote Share:")
+    print(f"  Democratic: {result['dem_vote_share']}% ({result['total_dem_votes']:,} votes)")
+    print(f"  Republican: {result['rep_vote_share']}% ({result['total_rep_votes']:,} votes)")
+    print(f"")
+    print(f"Seat Distribution:")
+    initial_rep_wins = result['num_districts'] - result['initial_dem_wins']
+    print(f"  Actual: {result['initial_dem_wins']} DEM, {initial_rep_wins} REP")
+    print(f"  Expected: {result['ensemble_mean']:.1f} DEM (±{result['ensemble_std']:.1f})")
+    print(f"")
+    print(f"Analysis:")
+    print(f"  Percentile: {result['percentile']}%")
+    print(f"  Z-score: {result['z_score']}")
+    print(f"  Gerrymandering detected: {'YES 🚨' if result['is_gerrymandered'] else 'NO ✅'}")
+
+    print(f"\n✅ Analysis complete at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+
 def main():
     """Run single-state gerrymandering detection"""
     print("="*70)
     print("ENHANCED SINGLE-STATE GERRYMANDERING DETECTION v2.0")
     print("="*70)
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Analyzing state: {STATE_NAME.upper()}")
+    state_names = [STATE_NAME] if isinstance(STATE_NAME, str) else list(STATE_NAME)
+    if len(state_names) == 1:
+        print(f"Analyzing state: {state_names[0].upper()}")
+    else:
+        print(f"Analyzing states: {', '.join(name.upper() for name in state_names)}")
 
     # Find data directory
     data_dir = "data/states"
@@ -1032,60 +1334,61 @@ def main():
         print(f"Expected: {os.path.abspath(data_dir)}")
         sys.exit(1)
 
-    # Find state directory
-    state_path = os.path.join(data_dir, STATE_NAME)
-    if not os.path.exists(state_path):
-        print(f"ERROR: State directory not found: {state_path}")
-        print(f"\nAvailable states:")
-        available_states = sorted([d for d in os.listdir(data_dir)
-                                  if os.path.isdir(os.path.join(data_dir, d))])
-        for state in available_states:
-            print(f"  - {state}")
-        sys.exit(1)
-
-    # Find shapefile
-    shapefile = find_shapefile(state_path)
-    if not shapefile:
-        print(f"ERROR: No shapefile found in {state_path}")
-        sys.exit(1)
+    shapefiles = {}
+    for state_name in state_names:
+        # Find state directory
+        state_path = os.path.join(data_dir, state_name)
+        if not os.path.exists(state_path):
+            print(f"ERROR: State directory not found: {state_path}")
+            print(f"\nAvailable states:")
+            available_states = sorted([d for d in os.listdir(data_dir)
+                                      if os.path.isdir(os.path.join(data_dir, d))])
+            for state in available_states:
+                print(f"  - {state}")
+            sys.exit(1)
+
+        # Find shapefile
+        shapefile = find_shapefile(state_path)
+        if not shapefile:
+            print(f"ERROR: No shapefile found in {state_path}")
+            sys.exit(1)
+        shapefiles[state_name] = shapefile
 
     # Determine number of districts
     num_districts = NUM_DISTRICTS
 
     # Run analysis
-    result = analyze_state(
-        STATE_NAME,
-        shapefile,
+    options = dict(
         num_districts=num_districts,
         num_steps=NUM_STEPS,
         epsilon=EPSILON,
         actual_districts_col=ACTUAL_DISTRICTS_COLUMN
     )
-
-    if result:
-        print(f"\n{'='*70}")
-        print(f"FINAL SUMMARY")
-        print(f"{'='*70}")
-        print(f"State: {STATE_NAME.upper()}")
-        print(f"Precincts analyzed: {result['precincts']}")
-        print(f"Districts: {result['num_districts']}")
-        print(f"")
-        print(f"Vote Share:")
-        print(f"  Democratic: {result['dem_vote_share']}% ({result['total_dem_votes']:,} votes)")
-        print(f"  Republican: {result['rep_vote_share']}% ({result['total_rep_votes']:,} votes)")
-        print(f"")
-        print(f"Seat Distribution:")
-        print(f"  Actual: {result['initial_dem_wins']} DEM, {result['num_districts']-result['initial_dem_wins']} REP")
-        print(f"  Expected: {result['ensemble_mean']:.1f} DEM (±{result['ensemble_std']:.1f})")
-        print(f"")
-        print(f"Analysis:")
-        print(f"  Percentile: {result['percentile']}%")
-        print(f"  Z-score: {result['z_score']}")
-        print(f"  Gerrymandering detected: {'YES 🚨' if result['is_gerrymandered'] else 'NO ✅'}")
-
-        print(f"\n✅ Analysis complete at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if len(state_names) == 1:
+        state_name = state_names[0]
+        results = {
+            state_name: analyze_state(state_name, shapefiles[state_name],
+                                      num_chains=NUM_CHAINS, **options)
+        }
     else:
-        print(f"\n❌ Analysis failed")
+        # One state per worker process, each running a single chain
+        specs = [
+            dict(state_name=state_name, shapefile_path=shapefiles[state_name],
+                 num_chains=1, **options)
+            for state_name in state_names
+        ]
+        results = dict(analyze_states_parallel(specs))
+
+    failed = False
+    for state_name in state_names:
+        result = results[state_name]
+        if result:
+            print_final_summary(state_name, result)
+        else:
+            print(f"\n❌ Analysis failed for {state_name.upper()}")
+            failed = True
+
+    if failed:
         sys.exit(1)
 
 
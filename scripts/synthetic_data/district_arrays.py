@@ -0,0 +1,51 @@
+"""
+NumPy helpers shared by the synthetic-data demos
+
+Population and vote counts are cached as arrays on the graph, so district
+totals for one or many maps come from ``np.bincount`` instead of per-node
+Python loops.
+"""
+
+import numpy as np
+
+
+def cache_node_arrays(graph):
+    """
+    Store population and vote counts as NumPy arrays on the graph, indexed by
+    integer node id (the position of the node in ``graph.nodes()``)
+    """
+    nodes = list(graph.nodes())
+    graph.graph["id_of"] = {node: i for i, node in enumerate(nodes)}
+    for attr in ("population", "dem_votes", "rep_votes"):
+        graph.graph[attr] = np.fromiter(
+            (graph.nodes[node][attr] for node in nodes), dtype=np.int64, count=len(nodes)
+        )
+
+
+def assignment_array(graph, assignment):
+    """
+    Convert an assignment dict into an integer array in ``graph.nodes()`` order
+    """
+    return np.fromiter((assignment[node] for node in graph.nodes()), dtype=np.int64,
+                       count=len(graph))
+
+
+def tally_all(graph, assignments, k):
+    """
+    Compute per-district population, Democratic and Republican totals for one
+    or more assignment arrays (shape ``(num_nodes,)`` or ``(num_maps, num_nodes)``)
+    using the cached node arrays
+
+    Every map's districts are offset into their own block of bins, so each
+    total is a single ``np.bincount`` over all maps at once. Returns three
+    ``(num_maps, k)`` arrays.
+    """
+    a = np.atleast_2d(assignments)
+    num_maps = a.shape[0]
+    bins = (a + k * np.arange(num_maps)[:, None]).ravel()
+
+    def tally(attr):
+        weights = np.tile(graph.graph[attr], num_maps)
+        return np.bincount(bins, weights=weights, minlength=k * num_maps).reshape(num_maps, k)
+
+    return tally("population"), tally("dem_votes"), tally("rep_votes")
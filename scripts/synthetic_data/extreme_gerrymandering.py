@@ -7,15 +7,31 @@ This creates a scenario where we manually create an obviously
 gerrymandered map and use GerryChain to prove it's unfair.
 """
 
+import itertools
+import logging
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import networkx as nx
-import pandas as pd
-from gerrychain import Graph, Partition, MarkovChain
-from gerrychain.proposals import propose_random_flip
-from gerrychain.constraints import single_flip_contiguous
-from gerrychain.updaters import cut_edges, Tally
+import numpy as np
+from gerrychain import Graph, Partition
+from gerrychain.updaters import Tally
 from gerrychain.tree import recursive_tree_part
+from district_arrays import cache_node_arrays, assignment_array, tally_all
 import random
 
+# Numba is optional: without it the MCMC kernel below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+log = logging.getLogger(__name__)
+
 def create_competitive_city(size=6):
     """
     Create a city where Democrats have about 55% of votes
@@ -66,30 +82,35 @@ def create_competitive_city(size=6):
     print(f"   {total_dem_votes} Democratic votes ({dem_percentage:.1f}%)")
     print(f"   {total_rep_votes} Republican votes ({100-dem_percentage:.1f}%)")
 
+    graph.graph["totals"] = (total_population, total_dem_votes, total_rep_votes)
+    cache_node_arrays(graph)
+
     return graph
 
+def count_dem_wins(dem_votes, rep_votes):
+    """
+    Count districts where Democrats out-vote Republicans, given the
+    per-district vote tallies of a partition
+    """
+    dem = np.fromiter(dem_votes.values(), dtype=np.int64, count=len(dem_votes))
+    rep = np.fromiter((rep_votes[d] for d in dem_votes), dtype=np.int64, count=len(dem_votes))
+    return int(np.count_nonzero(dem > rep))
+
 def create_fair_districts(graph):
     """
     Create a fair 4-district map using simple geographic division
     """
     print(f"\n✅ Creating FAIR 4-district map (geographic regions)...")
 
-    assignment = {}
-
     # Simple fair division: quadrants
-    for node in graph.nodes():
-        x, y = node
-        if x < 3 and y < 3:
-            assignment[node] = 0  # Bottom-left
-        elif x < 3:
-            assignment[node] = 1  # Top-left
-        elif y < 3:
-            assignment[node] = 2  # Bottom-right
-        else:
-            assignment[node] = 3  # Top-right
+    # 0 = bottom-left, 1 = top-left, 2 = bottom-right, 3 = top-right
+    nodes = list(graph.nodes())
+    xs = np.fromiter((x for x, _ in nodes), dtype=np.int64, count=len(nodes))
+    ys = np.fromiter((y for _, y in nodes), dtype=np.int64, count=len(nodes))
+    assign_arr = (xs >= 3).astype(np.int64) * 2 + (ys >= 3)
+    assignment = dict(zip(nodes, assign_arr.tolist()))
 
     updaters = {
-        "cut_edges": cut_edges,
         "population": Tally("population", alias="population"),
         "dem_votes": Tally("dem_votes", alias="dem_votes"),
         "rep_votes": Tally("rep_votes", alias="rep_votes"),
@@ -99,10 +120,13 @@ def create_fair_districts(graph):
 
     print("Fair districts:")
     dem_wins = 0
+    district_pops = partition["population"]
+    district_dems = partition["dem_votes"]
+    district_reps = partition["rep_votes"]
     for district_id in sorted(partition.parts.keys()):
-        pop = partition["population"][district_id]
-        dem = partition["dem_votes"][district_id]
-        rep = partition["rep_votes"][district_id]
+        pop = district_pops[district_id]
+        dem = district_dems[district_id]
+        rep = district_reps[district_id]
         winner = "DEM" if dem > rep else "REP"
         margin = abs(dem - rep)
 
@@ -114,6 +138,34 @@ def create_fair_districts(graph):
     print(f"   Fair result: Democrats win {dem_wins} out of 4 districts")
     return partition, dem_wins
 
+# Graph the trials of a process pool draw from, set once per worker
+_worker_graph = None
+
+# Trial plans memoized per graph, keyed by (seed, num_districts, target_pop,
+# epsilon) with None for a failed seed. Kept off the graph's attributes so
+# the plans are not pickled into every chain task along with the graph.
+_trial_cache = weakref.WeakKeyDictionary()
+
+def _init_trial_worker(graph):
+    """Stash the graph so each trial task only carries its parameters"""
+    global _worker_graph
+    _worker_graph = graph
+
+def _trial(args):
+    """
+    Draw one random plan for a given seed (process pool worker)
+    """
+    seed, num_districts, target_pop, epsilon = args
+    random.seed(seed)
+
+    return seed, recursive_tree_part(
+        _worker_graph,
+        range(num_districts),
+        target_pop,
+        "population",
+        epsilon=epsilon
+    )
+
 def create_gerrymandered_districts(graph, trials=50):
     """
     Create an obviously gerrymandered map by searching through random seeds
@@ -122,74 +174,65 @@ def create_gerrymandered_districts(graph, trials=50):
     print(f"\n🐍 Creating GERRYMANDERED 4-district map...")
     print(f"   Searching through {trials} algorithmic alternatives...")
 
-    total_pop = sum(graph.nodes[node]["population"] for node in graph.nodes())
+    total_pop, total_dem, total_rep = graph.graph["totals"]
     target_pop = total_pop / 4  # 4 districts
 
     # Calculate citywide Democratic vote share
-    total_dem = sum(graph.nodes[node]["dem_votes"] for node in graph.nodes())
-    total_rep = sum(graph.nodes[node]["rep_votes"] for node in graph.nodes())
     citywide_dem_pct = total_dem / (total_dem + total_rep) * 100
 
-    maps_data = []
-
-    for seed in range(trials):
-        random.seed(seed)
-
-        try:
-            assignment = recursive_tree_part(
-                graph,
-                range(4),
-                target_pop,
-                "population",
-                epsilon=0.25
-            )
-
-            updaters = {
-                "cut_edges": cut_edges,
-                "population": Tally("population", alias="population"),
-                "dem_votes": Tally("dem_votes", alias="dem_votes"),
-                "rep_votes": Tally("rep_votes", alias="rep_votes"),
-            }
-
-            partition = Partition(graph, assignment, updaters)
-
-            # Count Democratic wins
-            dem_wins = 0
-            for district_id in partition.parts.keys():
-                dem = partition["dem_votes"][district_id]
-                rep = partition["rep_votes"][district_id]
-                if dem > rep:
-                    dem_wins += 1
-
-            district_dem_pct = dem_wins / 4 * 100
-            gap = abs(district_dem_pct - citywide_dem_pct)
-
-            maps_data.append({
-                'seed': seed,
-                'partition': partition,
-                'dem_wins': dem_wins,
-                'gap': gap
-            })
+    # Each trial only depends on its seed, so run the ones not already
+    # cached across all cores; a seed where recursive_tree_part fails is
+    # simply skipped
+    trial_cache = _trial_cache.setdefault(graph, {})
+    keys = {seed: (seed, 4, target_pop, 0.25) for seed in range(trials)}
+    missing = [seed for seed, key in keys.items() if key not in trial_cache]
+
+    if missing:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_trial_worker,
+                                 initargs=(graph,)) as ex:
+            futures = {ex.submit(_trial, keys[seed]): seed for seed in missing}
+            for future in as_completed(futures):
+                try:
+                    _, assignment = future.result()
+                except Exception:
+                    assignment = None
+                trial_cache[keys[futures[future]]] = assignment
+
+    assignments = {
+        seed: trial_cache[key] for seed, key in keys.items() if trial_cache[key] is not None
+    }
 
-        except Exception:
-            continue
+    seeds = sorted(assignments)
+    assignments_arr = np.stack([assignment_array(graph, assignments[seed]) for seed in seeds])
 
-        random.seed()
+    # Score every candidate map at once; only the selected map needs a
+    # full Partition
+    _, dem_matrix, rep_matrix = tally_all(graph, assignments_arr, 4)
+    dem_wins_arr = (dem_matrix > rep_matrix).sum(axis=1)
 
     # Find the most biased map (largest gap favoring Republicans)
     # We want to MINIMIZE Democrat wins to show packing/cracking
-    maps_data.sort(key=lambda x: x['dem_wins'])
-    gerrymander_map = maps_data[0]  # Fewest Democratic wins
+    best = int(dem_wins_arr.argmin())  # Fewest Democratic wins
+    best_seed = seeds[best]
+
+    updaters = {
+        "population": Tally("population", alias="population"),
+        "dem_votes": Tally("dem_votes", alias="dem_votes"),
+        "rep_votes": Tally("rep_votes", alias="rep_votes"),
+    }
 
-    partition = gerrymander_map['partition']
-    dem_wins = gerrymander_map['dem_wins']
+    partition = Partition(graph, assignments[best_seed], updaters)
+    dem_wins = int(dem_wins_arr[best])
 
-    print(f"   Selected seed {gerrymander_map['seed']} with maximum bias")
+    print(f"   Selected seed {best_seed} with maximum bias")
     print("Gerrymandered districts:")
+    district_pops = partition["population"]
+    district_dems = partition["dem_votes"]
+    district_reps = partition["rep_votes"]
     for district_id in sorted(partition.parts.keys()):
-        pop = partition["population"][district_id]
-        dem = partition["dem_votes"][district_id]
-        rep = partition["rep_votes"][district_id]
+        pop = district_pops[district_id]
+        dem = district_dems[district_id]
+        rep = district_reps[district_id]
         winner = "DEM" if dem > rep else "REP"
         margin = abs(dem - rep)
 
@@ -200,43 +243,170 @@ def create_gerrymandered_districts(graph, trials=50):
 
     return partition, dem_wins
 
-def test_with_mcmc(partition, map_type, num_steps=1500):
+def graph_to_csr(graph):
+    """
+    Adjacency of the graph in CSR form (``indptr``, ``indices``), with nodes
+    numbered by their position in ``graph.nodes()``
+    """
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=list(graph.nodes()), format="csr")
+    return adjacency.indptr.astype(np.int64), adjacency.indices.astype(np.int64)
+
+@njit(cache=True)
+def mcmc_kernel(indptr, indices, assign, pop, dem, rep, k, steps, seed):
+    """
+    Single-flip MCMC chain on flat arrays, returning the number of
+    Democratic district wins at each of ``steps`` states (the first being
+    the initial map)
+
+    Mirrors ``propose_random_flip`` with ``single_flip_contiguous`` and an
+    always-accept rule: pick a cut edge uniformly, flip one of its endpoints
+    into the other's district, and retry until the flipped node's old
+    district stays connected. ``assign`` is updated in place. ``pop`` is
+    accepted for symmetry with the other node arrays; no population bound
+    is enforced, matching the GerryChain chain it replaces.
+    """
+    np.random.seed(seed)
+    n = assign.shape[0]
+
+    dem_sum = np.zeros(k, dtype=np.int64)
+    rep_sum = np.zeros(k, dtype=np.int64)
+    for v in range(n):
+        dem_sum[assign[v]] += dem[v]
+        rep_sum[assign[v]] += rep[v]
+
+    out = np.empty(steps, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.int8)
+    queue = np.empty(n, dtype=np.int64)
+    targets = np.empty(n, dtype=np.int64)
+
+    for step in range(steps):
+        if step > 0:
+            while True:
+                # Uniform random cut edge (each undirected edge counted once)
+                num_cut = 0
+                for u in range(n):
+                    for e in range(indptr[u], indptr[u + 1]):
+                        if u < indices[e] and assign[u] != assign[indices[e]]:
+                            num_cut += 1
+                if num_cut == 0:
+                    break
+                r = np.random.randint(0, num_cut)
+                edge_u = -1
+                edge_v = -1
+                for u in range(n):
+                    for e in range(indptr[u], indptr[u + 1]):
+                        if u < indices[e] and assign[u] != assign[indices[e]]:
+                            if r == 0:
+                                edge_u = u
+                                edge_v = indices[e]
+                            r -= 1
+                    if edge_u >= 0:
+                        break
+                if np.random.randint(0, 2) == 0:
+                    node, other = edge_u, edge_v
+                else:
+                    node, other = edge_v, edge_u
+                old = assign[node]
+                new = assign[other]
+
+                # The old district must keep a neighbor of the flipped node...
+                num_targets = 0
+                for e in range(indptr[node], indptr[node + 1]):
+                    if assign[indices[e]] == old:
+                        targets[num_targets] = indices[e]
+                        num_targets += 1
+                if num_targets == 0:
+                    continue
+
+                # ...and those neighbors must stay connected without it
+                visited[:] = 0
+                visited[node] = 1
+                visited[targets[0]] = 1
+                head = 0
+                tail = 1
+                queue[0] = targets[0]
+                while head < tail:
+                    v = queue[head]
+                    head += 1
+                    for e in range(indptr[v], indptr[v + 1]):
+                        w = indices[e]
+                        if visited[w] == 0 and assign[w] == old:
+                            visited[w] = 1
+                            queue[tail] = w
+                            tail += 1
+                connected = True
+                for t in range(num_targets):
+                    if visited[targets[t]] == 0:
+                        connected = False
+                        break
+                if not connected:
+                    continue
+
+                assign[node] = new
+                dem_sum[old] -= dem[node]
+                dem_sum[new] += dem[node]
+                rep_sum[old] -= rep[node]
+                rep_sum[new] += rep[node]
+                break
+
+        wins = 0
+        for d in range(k):
+            if dem_sum[d] > rep_sum[d]:
+                wins += 1
+        out[step] = wins
+
+    return out
+
+def _run_chain(args):
+    """
+    Run one independent MCMC chain and return its Democratic win counts
+    (multiprocessing worker)
+    """
+    graph, assignment, num_steps, seed = args
+
+    indptr, indices = graph_to_csr(graph)
+    assign = assignment_array(graph, assignment)
+    k = int(assign.max()) + 1
+
+    out = mcmc_kernel(
+        indptr, indices, assign,
+        graph.graph["population"], graph.graph["dem_votes"], graph.graph["rep_votes"],
+        k, num_steps, seed
+    )
+    return out.tolist()
+
+def test_with_mcmc(partition, map_type, num_steps=1500, num_chains=None):
     """
     Test a district map using MCMC to see if it's fair
+
+    The steps are split across ``num_chains`` independent chains (one per
+    core by default) that all start from the given map; their samples are
+    pooled into a single ensemble.
     """
+    if num_chains is None:
+        num_chains = os.cpu_count() or 1
+    num_chains = max(1, min(num_chains, num_steps))
+
     print(f"\n🎲 Testing {map_type} map with {num_steps} MCMC steps...")
 
     # Count Democratic wins in original
-    original_dem_wins = 0
-    for district_id in partition.parts.keys():
-        dem_votes = partition["dem_votes"][district_id]
-        rep_votes = partition["rep_votes"][district_id]
-        if dem_votes > rep_votes:
-            original_dem_wins += 1
+    original_dem_wins = count_dem_wins(partition["dem_votes"], partition["rep_votes"])
 
     # Run MCMC
-    chain = MarkovChain(
-        proposal=propose_random_flip,
-        constraints=[single_flip_contiguous],
-        accept=lambda x: True,
-        initial_state=partition,
-        total_steps=num_steps
-    )
+    tasks = [
+        (partition.graph.graph, dict(partition.assignment),
+         num_steps // num_chains + (seed < num_steps % num_chains), seed)
+        for seed in range(num_chains)
+    ]
 
-    dem_wins_list = []
+    results = []
+    with multiprocessing.Pool(min(num_chains, os.cpu_count() or 1)) as pool:
+        for chain_wins in pool.imap(_run_chain, tasks):
+            results.append(chain_wins)
+            log.info("Chain %d/%d: analyzed %d alternative maps",
+                     len(results), num_chains, sum(len(r) for r in results))
 
-    for i, state in enumerate(chain):
-        dem_wins = 0
-        for district_id in state.parts.keys():
-            dem_votes = state["dem_votes"][district_id]
-            rep_votes = state["rep_votes"][district_id]
-            if dem_votes > rep_votes:
-                dem_wins += 1
-
-        dem_wins_list.append(dem_wins)
-
-        if (i + 1) % 300 == 0:
-            print(f"   Step {i + 1}: Analyzed {i + 1} alternative maps")
+    dem_wins_list = list(itertools.chain.from_iterable(results))
 
     return dem_wins_list, original_dem_wins
 
@@ -247,24 +417,24 @@ def analyze_map_fairness(dem_wins_list, original_dem_wins, map_type):
     print(f"\n📊 ANALYSIS: {map_type} Map")
     print("=" * 40)
 
-    df = pd.DataFrame({"dem_districts": dem_wins_list})
+    arr = np.asarray(dem_wins_list, dtype=np.int32)
+    # Rows for 0..3 Democratic districts, plus any higher counts that occur
+    counts = np.bincount(arr, minlength=4)
 
     print(f"Original map: Democrats win {original_dem_wins} out of 3 districts")
-    print(f"\nIn {len(dem_wins_list)} alternative maps:")
-    print(f"   Average Democratic wins: {df['dem_districts'].mean():.2f}")
-    print(f"   Most common result: {df['dem_districts'].mode().iloc[0]} districts")
+    print(f"\nIn {len(arr)} alternative maps:")
+    print(f"   Average Democratic wins: {arr.mean():.2f}")
+    print(f"   Most common result: {int(counts.argmax())} districts")
 
     # Show full distribution
     print(f"\nDistribution:")
-    for districts in range(4):
-        count = (df['dem_districts'] == districts).sum()
-        percentage = (count / len(dem_wins_list)) * 100
+    for districts, count in enumerate(counts):
+        percentage = (count / len(arr)) * 100
         indicator = " ← Original" if districts == original_dem_wins else ""
         print(f"   {districts} districts: {count:4d} times ({percentage:5.1f}%){indicator}")
 
     # Calculate how unusual the original result is
-    original_count = (df['dem_districts'] == original_dem_wins).sum()
-    original_percentile = (original_count / len(dem_wins_list)) * 100
+    original_percentile = np.count_nonzero(arr == original_dem_wins) / len(arr) * 100
 
     print(f"\n🔍 VERDICT:")
     if original_percentile < 5:
@@ -282,6 +452,9 @@ def main():
     """
     Compare fair vs gerrymandered maps
     """
+    # Chain progress is logged at INFO; lower the level to see it
+    logging.basicConfig(level=logging.WARNING, format="   %(message)s")
+
     print("🕵️  EXTREME GERRYMANDERING DETECTION")
     print("=" * 50)
 
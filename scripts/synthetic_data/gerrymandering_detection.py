@@ -11,16 +11,23 @@ This script demonstrates how GerryChain can detect gerrymandering by:
 Think of this as creating evidence for a court case!
 """
 
+import itertools
+import logging
+import multiprocessing
+import os
 import matplotlib.pyplot as plt
 import networkx as nx
-import pandas as pd
+import numpy as np
 from gerrychain import Graph, Partition, MarkovChain
 from gerrychain.proposals import propose_random_flip
 from gerrychain.constraints import single_flip_contiguous
-from gerrychain.updaters import cut_edges, Tally
+from gerrychain.updaters import Tally
 from gerrychain.tree import recursive_tree_part
+from district_arrays import cache_node_arrays, assignment_array, tally_all
 import random
 
+log = logging.getLogger(__name__)
+
 def create_polarized_city(size=10):
     """
     Create a city where voters are geographically clustered by party
@@ -38,49 +45,58 @@ def create_polarized_city(size=10):
     graph = Graph(grid)
 
     center = size // 2
-    total_population = 0
-
-    for node in graph.nodes():
-        x, y = node
-        # Distance from city center
-        distance_from_center = ((x - center) ** 2 + (y - center) ** 2) ** 0.5
-
-        # Population: more dense in center
-        if distance_from_center < 2:
-            population = random.randint(15, 20)  # Dense urban core
-        elif distance_from_center < 4:
-            population = random.randint(10, 15)  # Suburbs
-        else:
-            population = random.randint(5, 10)   # Rural areas
-
-        graph.nodes[node]["population"] = population
-        total_population += population
-
-        # Voting patterns: Democrats cluster in center, Republicans in outer areas
-        if distance_from_center < 2.5:
-            # Urban core: 80% Democrat, 20% Republican
-            dem_votes = int(population * (0.8 + random.uniform(-0.1, 0.1)))
-        elif distance_from_center < 4:
-            # Suburbs: 40% Democrat, 60% Republican
-            dem_votes = int(population * (0.4 + random.uniform(-0.15, 0.15)))
-        else:
-            # Rural: 20% Democrat, 80% Republican
-            dem_votes = int(population * (0.2 + random.uniform(-0.1, 0.1)))
-
-        rep_votes = population - dem_votes
-
-        # Ensure non-negative votes
-        graph.nodes[node]["dem_votes"] = max(0, dem_votes)
-        graph.nodes[node]["rep_votes"] = max(0, rep_votes)
+    xs, ys = np.indices((size, size))
+    # Distance from city center
+    distance_from_center = np.sqrt((xs - center) ** 2 + (ys - center) ** 2)
+
+    # Population: more dense in center
+    population = np.where(
+        distance_from_center < 2,
+        np.random.randint(15, 21, (size, size)),  # Dense urban core
+        np.where(
+            distance_from_center < 4,
+            np.random.randint(10, 16, (size, size)),  # Suburbs
+            np.random.randint(5, 11, (size, size)),   # Rural areas
+        ),
+    )
+
+    # Voting patterns: Democrats cluster in center, Republicans in outer areas
+    # Urban core: 80% Democrat, suburbs: 40% Democrat, rural: 20% Democrat
+    dem_share = np.where(
+        distance_from_center < 2.5,
+        0.8 + np.random.uniform(-0.1, 0.1, (size, size)),
+        np.where(
+            distance_from_center < 4,
+            0.4 + np.random.uniform(-0.15, 0.15, (size, size)),
+            0.2 + np.random.uniform(-0.1, 0.1, (size, size)),
+        ),
+    )
+    dem_votes = (population * dem_share).astype(np.int64)
+    rep_votes = population - dem_votes
+
+    # Ensure non-negative votes
+    dem_votes = np.maximum(dem_votes, 0)
+    rep_votes = np.maximum(rep_votes, 0)
+
+    for node, pop, dem, rep in zip(graph.nodes(), population.ravel().tolist(),
+                                   dem_votes.ravel().tolist(), rep_votes.ravel().tolist()):
+        graph.nodes[node]["population"] = pop
+        graph.nodes[node]["dem_votes"] = dem
+        graph.nodes[node]["rep_votes"] = rep
+
+    total_population = int(population.sum())
+    total_dem = int(dem_votes.sum())
+    total_rep = int(rep_votes.sum())
 
     print(f"✅ Created polarized city: {total_population} people in {len(graph.nodes)} blocks")
 
     # Show overall vote totals
-    total_dem = sum(graph.nodes[node]["dem_votes"] for node in graph.nodes())
-    total_rep = sum(graph.nodes[node]["rep_votes"] for node in graph.nodes())
     print(f"   City-wide votes: {total_dem} Democratic, {total_rep} Republican")
     print(f"   Democratic percentage: {total_dem/(total_dem + total_rep)*100:.1f}%")
 
+    graph.graph["totals"] = (total_population, total_dem, total_rep)
+    cache_node_arrays(graph)
+
     return graph
 
 def create_fair_districts(graph, num_districts=5):
@@ -89,7 +105,7 @@ def create_fair_districts(graph, num_districts=5):
     """
     print(f"\n🗺️  Creating {num_districts} FAIR districts...")
 
-    total_pop = sum(graph.nodes[node]["population"] for node in graph.nodes())
+    total_pop, _, _ = graph.graph["totals"]
     target_pop = total_pop / num_districts
 
     assignment = recursive_tree_part(
@@ -101,7 +117,6 @@ def create_fair_districts(graph, num_districts=5):
     )
 
     updaters = {
-        "cut_edges": cut_edges,
         "population": Tally("population", alias="population"),
         "dem_votes": Tally("dem_votes", alias="dem_votes"),
         "rep_votes": Tally("rep_votes", alias="rep_votes"),
@@ -111,10 +126,13 @@ def create_fair_districts(graph, num_districts=5):
 
     print("✅ Fair districts created:")
     dem_wins = 0
+    district_pops = partition["population"]
+    district_dems = partition["dem_votes"]
+    district_reps = partition["rep_votes"]
     for district_id in partition.parts.keys():
-        pop = partition["population"][district_id]
-        dem = partition["dem_votes"][district_id]
-        rep = partition["rep_votes"][district_id]
+        pop = district_pops[district_id]
+        dem = district_dems[district_id]
+        rep = district_reps[district_id]
         winner = "DEM" if dem > rep else "REP"
         if dem > rep:
             dem_wins += 1
@@ -130,65 +148,43 @@ def create_gerrymandered_districts(graph, num_districts=5):
     """
     print(f"\n🐍 Creating {num_districts} GERRYMANDERED districts (favoring Republicans)...")
 
-    # Get all nodes with their voting patterns
-    nodes_data = []
-    for node in graph.nodes():
-        dem_votes = graph.nodes[node]["dem_votes"]
-        rep_votes = graph.nodes[node]["rep_votes"]
-        total_votes = dem_votes + rep_votes
-        dem_percentage = dem_votes / total_votes if total_votes > 0 else 0
-
-        nodes_data.append({
-            'node': node,
-            'population': graph.nodes[node]["population"],
-            'dem_votes': dem_votes,
-            'rep_votes': rep_votes,
-            'dem_percentage': dem_percentage
-        })
+    # Get all nodes with their voting patterns, as parallel arrays
+    node_list = list(graph.nodes())
+    pops = graph.graph["population"]
+    dems = graph.graph["dem_votes"]
+    reps = graph.graph["rep_votes"]
+    dem_percentage = dems / np.maximum(dems + reps, 1)
 
     # Sort by Democratic percentage (highest first)
-    nodes_data.sort(key=lambda x: x['dem_percentage'], reverse=True)
+    order = np.argsort(-dem_percentage, kind="stable")
+    nodes = [node_list[i] for i in order]
+    pops = pops[order]
 
     # GERRYMANDERING STRATEGY:
     # District 0: Pack as many Democrats as possible
     # Districts 1-4: Spread Republicans to create slight majorities
 
-    assignment = {}
-    district_populations = [0] * num_districts
-    district_dem_votes = [0] * num_districts
-    district_rep_votes = [0] * num_districts
-
-    total_pop = sum(graph.nodes[node]["population"] for node in graph.nodes())
+    total_pop, _, _ = graph.graph["totals"]
     target_pop = total_pop / num_districts
 
-    # First, create one heavily Democratic district (packing)
-    current_district = 0
-    for node_data in nodes_data:
-        if district_populations[current_district] < target_pop * 1.3:  # Allow overpacking
-            node = node_data['node']
-            assignment[node] = current_district
-            district_populations[current_district] += node_data['population']
-            district_dem_votes[current_district] += node_data['dem_votes']
-            district_rep_votes[current_district] += node_data['rep_votes']
-        else:
-            break
-
-    # Now assign remaining nodes to create Republican-leaning districts
-    remaining_nodes = [n['node'] for n in nodes_data if n['node'] not in assignment]
-
-    # Distribute remaining nodes to favor Republicans
-    for i, node in enumerate(remaining_nodes):
-        # Cycle through districts 1-4
-        district = (i % (num_districts - 1)) + 1
-        assignment[node] = district
-
-        district_populations[district] += graph.nodes[node]["population"]
-        district_dem_votes[district] += graph.nodes[node]["dem_votes"]
-        district_rep_votes[district] += graph.nodes[node]["rep_votes"]
+    # First, create one heavily Democratic district (packing): nodes join
+    # district 0 while its population is still below the threshold, i.e.
+    # up to and including the first node whose running total reaches it
+    cum_pop = np.cumsum(pops)
+    packed_count = min(
+        int(np.searchsorted(cum_pop, target_pop * 1.3, side="left")) + 1,  # Allow overpacking
+        len(nodes)
+    )
+
+    # Now assign remaining nodes to create Republican-leaning districts,
+    # cycling through districts 1-4
+    district_of = np.zeros(len(nodes), dtype=np.int64)
+    district_of[packed_count:] = (np.arange(len(nodes) - packed_count) % (num_districts - 1)) + 1
+
+    assignment = dict(zip(nodes, district_of.tolist()))
 
     # Create the gerrymandered partition
     updaters = {
-        "cut_edges": cut_edges,
         "population": Tally("population", alias="population"),
         "dem_votes": Tally("dem_votes", alias="dem_votes"),
         "rep_votes": Tally("rep_votes", alias="rep_votes"),
@@ -198,10 +194,13 @@ def create_gerrymandered_districts(graph, num_districts=5):
 
     print("🐍 GERRYMANDERED districts created:")
     dem_wins = 0
+    district_pops = partition["population"]
+    district_dems = partition["dem_votes"]
+    district_reps = partition["rep_votes"]
     for district_id in partition.parts.keys():
-        pop = partition["population"][district_id]
-        dem = partition["dem_votes"][district_id]
-        rep = partition["rep_votes"][district_id]
+        pop = district_pops[district_id]
+        dem = district_dems[district_id]
+        rep = district_reps[district_id]
         winner = "DEM" if dem > rep else "REP"
         if dem > rep:
             dem_wins += 1
@@ -211,38 +210,86 @@ def create_gerrymandered_districts(graph, num_districts=5):
     print(f"   GERRYMANDERED RESULT: Democrats win {dem_wins} out of {num_districts} districts")
     return partition, dem_wins
 
-def run_mcmc_analysis(gerrymandered_partition, num_steps=2000):
+def _run_chain(args):
     """
-    Run MCMC to generate fair alternatives and analyze the gerrymandered map
+    Run one independent MCMC chain and return its Democratic win counts
+    (multiprocessing worker)
     """
-    print(f"\n🎲 Running MCMC analysis with {num_steps} steps...")
-    print("   Generating fair alternative maps to compare against...")
+    graph, assignment, num_steps, seed = args
+    random.seed(seed)
+
+    # No Tally updaters: the chain never reads them, votes are tracked below
+    partition = Partition(graph, assignment)
 
     chain = MarkovChain(
         proposal=propose_random_flip,
         constraints=[single_flip_contiguous],
         accept=lambda x: True,
-        initial_state=gerrymandered_partition,
+        initial_state=partition,
         total_steps=num_steps
     )
 
+    # Start from bincount district totals, then apply each step's flips
+    # instead of recomputing Tallies
+    k = max(assignment.values()) + 1
+    _, dems, reps = tally_all(graph, assignment_array(graph, assignment), k)
+    dem_by_dist = dems[0].astype(np.int64)
+    rep_by_dist = reps[0].astype(np.int64)
+
+    id_of = graph.graph["id_of"]
+    dem_arr = graph.graph["dem_votes"]
+    rep_arr = graph.graph["rep_votes"]
+    current = dict(assignment)
+
     dem_wins_list = []
+    previous = None
+
+    for state in chain:
+        if state.flips and state is not previous:
+            for node, new_part in state.flips.items():
+                old, new = current[node], new_part
+                i = id_of[node]
+                dem_by_dist[old] -= dem_arr[i]
+                dem_by_dist[new] += dem_arr[i]
+                rep_by_dist[old] -= rep_arr[i]
+                rep_by_dist[new] += rep_arr[i]
+                current[node] = new_part
+        previous = state
+
+        dem_wins_list.append(int((dem_by_dist > rep_by_dist).sum()))
+
+    return dem_wins_list
+
+def run_mcmc_analysis(gerrymandered_partition, num_steps=2000, num_chains=None):
+    """
+    Run MCMC to generate fair alternatives and analyze the gerrymandered map
 
-    for i, partition in enumerate(chain):
-        # Count Democratic wins in this map
-        dem_wins = 0
-        for district_id in partition.parts.keys():
-            dem_votes = partition["dem_votes"][district_id]
-            rep_votes = partition["rep_votes"][district_id]
-            if dem_votes > rep_votes:
-                dem_wins += 1
+    The steps are split across ``num_chains`` independent chains (one per
+    core by default) that all start from the given map; their samples are
+    pooled into a single ensemble.
+    """
+    if num_chains is None:
+        num_chains = os.cpu_count() or 1
+    num_chains = max(1, min(num_chains, num_steps))
 
-        dem_wins_list.append(dem_wins)
+    print(f"\n🎲 Running MCMC analysis with {num_steps} steps...")
+    print("   Generating fair alternative maps to compare against...")
 
-        if (i + 1) % 400 == 0:
-            print(f"   Step {i + 1}: Generated {i + 1} alternative maps")
+    partition = gerrymandered_partition
+    tasks = [
+        (partition.graph.graph, dict(partition.assignment),
+         num_steps // num_chains + (seed < num_steps % num_chains), seed)
+        for seed in range(num_chains)
+    ]
 
-    return dem_wins_list
+    results = []
+    with multiprocessing.Pool(min(num_chains, os.cpu_count() or 1)) as pool:
+        for chain_wins in pool.imap(_run_chain, tasks):
+            results.append(chain_wins)
+            log.info("Chain %d/%d: generated %d alternative maps",
+                     len(results), num_chains, sum(len(r) for r in results))
+
+    return list(itertools.chain.from_iterable(results))
 
 def analyze_gerrymandering(dem_wins_list, original_dem_wins, fair_dem_wins):
     """
@@ -251,27 +298,26 @@ def analyze_gerrymandering(dem_wins_list, original_dem_wins, fair_dem_wins):
     print(f"\n📊 GERRYMANDERING DETECTION ANALYSIS")
     print("=" * 60)
 
-    df = pd.DataFrame({"dem_districts": dem_wins_list})
+    arr = np.asarray(dem_wins_list, dtype=np.int32)
+    counts = np.bincount(arr, minlength=5 + 1)  # 0..5 Democratic districts
 
     print(f"🐍 Gerrymandered map: Democrats win {original_dem_wins} districts")
     print(f"✅ Fair map (for comparison): Democrats win {fair_dem_wins} districts")
-    print(f"\nIn {len(dem_wins_list)} fair alternative maps:")
-    print(f"   Average Democratic districts: {df['dem_districts'].mean():.2f}")
-    print(f"   Most common result: {df['dem_districts'].mode().iloc[0]} districts")
-    print(f"   Range: {df['dem_districts'].min()} - {df['dem_districts'].max()} districts")
+    print(f"\nIn {len(arr)} fair alternative maps:")
+    print(f"   Average Democratic districts: {arr.mean():.2f}")
+    print(f"   Most common result: {int(counts.argmax())} districts")
+    print(f"   Range: {arr.min()} - {arr.max()} districts")
 
     # Distribution analysis
     print(f"\n📈 Distribution of Democratic wins in fair maps:")
-    for districts in range(6):
-        count = (df['dem_districts'] == districts).sum()
-        percentage = (count / len(dem_wins_list)) * 100
+    for districts, count in enumerate(counts):
+        percentage = (count / len(arr)) * 100
         if count > 0:
             marker = "👈 GERRYMANDERED RESULT" if districts == original_dem_wins else ""
             print(f"   {districts} districts: {count} times ({percentage:.1f}%) {marker}")
 
     # Statistical significance test
-    original_count = (df['dem_districts'] == original_dem_wins).sum()
-    original_percentile = (original_count / len(dem_wins_list)) * 100
+    original_percentile = counts[original_dem_wins] / len(arr) * 100
 
     print(f"\n🔍 SMOKING GUN EVIDENCE:")
     print(f"   The gerrymandered result ({original_dem_wins} Democratic districts)")
@@ -287,7 +333,7 @@ def analyze_gerrymandering(dem_wins_list, original_dem_wins, fair_dem_wins):
         print(f"   ✅ Normal result - no gerrymandering detected")
 
     # Compare to what we'd expect
-    expected_dem_districts = df['dem_districts'].mean()
+    expected_dem_districts = arr.mean()
     print(f"\n📏 Expected vs Actual:")
     print(f"   Expected Democratic districts: {expected_dem_districts:.1f}")
     print(f"   Gerrymandered result: {original_dem_wins}")
@@ -295,11 +341,15 @@ def analyze_gerrymandering(dem_wins_list, original_dem_wins, fair_dem_wins):
 
 def main():
     """Run the complete gerrymandering detection demo"""
+    # Chain progress is logged at INFO; lower the level to see it
+    logging.basicConfig(level=logging.WARNING, format="   %(message)s")
+
     print("🕵️  GERRYMANDERING DETECTION DEMONSTRATION")
     print("=" * 70)
     print("We'll create a fair map, then gerrymander it, then use MCMC to prove it!")
 
     random.seed(12345)  # For reproducible results
+    np.random.seed(12345)
 
     # Step 1: Create a realistic polarized city
     graph = create_polarized_city(size=10)
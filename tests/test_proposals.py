@@ -25,8 +25,36 @@ def partition(graph):
         proposals.slow_reversible_propose,
         proposals.slow_reversible_propose_bi,
         proposals.spectral_recom,
+        proposals.NonReversibleFlip(),
     ],
 )
 def test_proposal_returns_a_partition(proposal, partition):
     proposed = proposal(partition)
     assert isinstance(proposed, partition.__class__)
+
+
+def test_non_reversible_flip_moves_in_its_direction(partition):
+    proposal = proposals.NonReversibleFlip(switch_probability=0)
+    proposal.direction = (2, 3)
+
+    state = partition
+    for _ in range(3):
+        proposed = proposal(state)
+        (node, part), = proposed.flips.items()
+        assert state.assignment[node] == 2
+        assert part == 3
+        state = proposed
+
+
+def test_non_reversible_flip_reverses_after_rejection(partition):
+    proposal = proposals.NonReversibleFlip(switch_probability=0)
+    proposal.direction = (2, 3)
+
+    proposal(partition)
+    # Proposing again from the same partition means the last one was rejected
+    proposed = proposal(partition)
+    (node, part), = proposed.flips.items()
+
+    assert proposal.direction == (3, 2)
+    assert partition.assignment[node] == 3
+    assert part == 2